@@ -34,6 +34,7 @@ Pytest (tomasulo unit tests only):
 import os
 import random
 import re
+import shutil
 import subprocess
 import sys
 import tempfile
@@ -91,6 +92,12 @@ COREMARK_PRO_TESTS = {
     for program in COREMARK_PRO_PROGRAMS
 }
 
+# Verilator model optimizations for the long-running pipelined FP shim
+# benches (tens of cycles of latency per op, thousands of cycles per test).
+# They never check X propagation, so trade verilation time for a faster
+# model.  Waveform tracing is already opt-in via WAVES=1 in tests/Makefile.
+FAST_UNIT_VERILATOR_ARGS = ("-O3", "--x-assign", "fast", "--x-initial", "fast")
+
 # Registry of all available tests - single source of truth
 # Maps test name to its configuration
 TEST_REGISTRY: dict[str, CocotbRunConfig] = {
@@ -590,11 +597,13 @@ TEST_REGISTRY: dict[str, CocotbRunConfig] = {
         python_test_module="cocotb_tests.tomasulo.fu_shims.test_fp_mul_shim",
         hdl_toplevel_module="fp_mul_shim",
         description="FP mul shim unit tests (FMUL, FMADD, FMSUB, FNMADD, FNMSUB)",
+        verilator_extra_args=FAST_UNIT_VERILATOR_ARGS,
     ),
     "fp_div_shim": CocotbRunConfig(
         python_test_module="cocotb_tests.tomasulo.fu_shims.test_fp_div_shim",
         hdl_toplevel_module="fp_div_shim",
         description="FP div shim unit tests (FDIV, FSQRT, flush)",
+        verilator_extra_args=FAST_UNIT_VERILATOR_ARGS,
     ),
     "dispatch": CocotbRunConfig(
         python_test_module="cocotb_tests.tomasulo.dispatch.test_dispatch",
@@ -964,6 +973,10 @@ class CocotbRunner:
         # skip the (racy) per-run clean+recompile and leave symlink cleanup
         # to the parent.
         self.skip_app_compile = False
+        # Set by run_test() under pytest-xdist: concurrent unit benches each
+        # get their own sim_build_<key>/ and results_<key>.xml in tests/
+        # instead of fighting over the shared sim_build/ and results.xml.
+        self.build_key: str | None = None
         self.test_directory = Path(__file__).parent.resolve()
         self.repository_root_directory = self.test_directory.parent
         # Memory tier for the compiled app (real-program tests). The ddr CI job
@@ -985,6 +998,18 @@ class CocotbRunner:
         """Return the build args string consumed by tests/Makefile."""
         return " ".join(self.verilator_extra_args)
 
+    def _verilator_build_signature(self) -> str:
+        """Return the extra-args marker contents, including waveform tracing.
+
+        A WAVES=1 build compiles trace instrumentation into Vtop. Recording
+        it here makes the next WAVES=0 run rebuild an untraced model instead
+        of reusing the slower traced one.
+        """
+        signature = self._verilator_extra_args_string()
+        if os.environ.get("WAVES", "0") == "1":
+            signature += " WAVES=1"
+        return signature
+
     def _compile_app(self) -> bool:
         """Compile the application if app_name is set.
 
@@ -1072,6 +1097,18 @@ class CocotbRunner:
         if self.mem_config == "ddr":
             environment_variables["COCOTB_NUM_RUNS"] = "1"
 
+        # An explicit SIM_BUILD (seed-sweep workers, the user) wins.
+        if self.build_key and not environment_variables.get("SIM_BUILD"):
+            environment_variables["SIM_BUILD"] = str(
+                self.test_directory / f"sim_build_{self.build_key}"
+            )
+            environment_variables["COCOTB_RESULTS_FILE"] = str(
+                self.test_directory / f"results_{self.build_key}.xml"
+            )
+            environment_variables["WAVES_FILE"] = str(
+                self.test_directory / f"dump_{self.build_key}.fst"
+            )
+
         return environment_variables
 
     def check_for_failures(
@@ -1174,7 +1211,7 @@ class CocotbRunner:
             return (
                 last_toplevel != self.hdl_toplevel_module
                 or last_cocotb_libs != cocotb_libs_dir
-                or last_verilator_extra_args != self._verilator_extra_args_string()
+                or last_verilator_extra_args != self._verilator_build_signature()
             )
         except OSError:
             return False
@@ -1189,7 +1226,7 @@ class CocotbRunner:
         cocotb_libs_marker.write_text(
             str((Path(cocotb.__file__).resolve().parent / "libs").resolve())
         )
-        verilator_extra_args_marker.write_text(self._verilator_extra_args_string())
+        verilator_extra_args_marker.write_text(self._verilator_build_signature())
 
     def _verilator_build_dir_writable(self, sim_build_dir: Path) -> bool:
         """Return True when the existing Verilator build dir can be rebuilt in place."""
@@ -1241,9 +1278,17 @@ class CocotbRunner:
                 env["SIM_BUILD"] = str(sim_build_dir)
                 needs_clean = False
 
-            if needs_clean:
+            if needs_clean and self.build_key:
+                # Keyed (xdist) runs remove only their own outputs: `make clean`
+                # also runs clean-local, which deletes the shared sim_build/,
+                # results.xml and sw*.mem links other workers may be using.
+                shutil.rmtree(sim_build_dir, ignore_errors=True)
+                results_file = env.get("COCOTB_RESULTS_FILE")
+                if results_file:
+                    Path(results_file).unlink(missing_ok=True)
+            elif needs_clean:
                 # Don't fail on clean errors (e.g., permission denied on root-owned files)
-                subprocess.run(["make", "clean"], check=False)
+                subprocess.run(["make", "clean"], check=False, env=env)
 
             # Set up program memory symlinks if needed (low BRAM image + the
             # cached-region DDR image consumed by the behavioral DDR model)
@@ -1320,6 +1365,11 @@ def run_test(test_name: str, capsys: Any | None = None) -> None:
     os.environ["SIM"] = "verilator"
     config = TEST_REGISTRY[test_name]
     runner = CocotbRunner.from_config(config)
+    # Under `pytest -n N` each unit bench builds in its own directory so the
+    # workers can elaborate and simulate concurrently. Real programs share
+    # the tests/sw*.mem symlinks and are skipped there (see test_real_program).
+    if os.environ.get("PYTEST_XDIST_WORKER") and config.app_name is None:
+        runner.build_key = test_name
 
     if capsys is not None:
         with capsys.disabled():
@@ -1356,6 +1406,10 @@ class TestRealPrograms:
             test_real_program[hello_world]
             test_real_program[coremark]
         """
+        if os.environ.get("PYTEST_XDIST_WORKER"):
+            pytest.skip(
+                "real programs share tests/sim_build and sw*.mem; run them without -n"
+            )
         mem_config = os.environ.get("FROST_COCOTB_MEM_CONFIG", "bram")
         if mem_config == "ddr" and test_name in DDR_TIER_EXCLUDE:
             pytest.skip(f"{test_name} does not run in the ddr tier (fuzz/ddr-only)")
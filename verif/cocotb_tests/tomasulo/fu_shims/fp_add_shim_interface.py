@@ -18,11 +18,25 @@ Provides packing/unpacking for rs_issue_t and fu_complete_t structs,
 and transaction helpers for driving stimulus and reading results.
 """
 
+import functools
 import re
+from collections.abc import Mapping
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-from cocotb.triggers import FallingEdge, RisingEdge
+import cocotb
+from cocotb.triggers import (
+    ClockCycles,
+    FallingEdge,
+    First,
+    ReadOnly,
+    RisingEdge,
+    Timer,
+    Trigger,
+)
+from cocotb.types import LogicArray
 from config import FLEN, XLEN
 
 # =============================================================================
@@ -178,12 +192,149 @@ def pack_rs_issue(
     return val
 
 
-def unpack_fu_complete(raw: int) -> dict:
-    """Unpack a fu_complete_t bit vector into a dict.
+# Bit offsets of the rs_issue_t fields used by the two-operand fast paths.
+# These must track the packing order in pack_rs_issue above.
+_S_RM = (
+    3  # branch_op
+    + 5  # is_jalr, is_jal, is_branch_class, is_return, is_call
+    + CHECKPOINT_ID_WIDTH
+    + 1  # has_checkpoint
+    + XLEN  # link_addr
+    + XLEN  # pc
+    + 5  # csr_imm
+    + 12  # csr_addr
+    + 1  # mem_signed
+    + MEM_SIZE_WIDTH
+    + 3  # mem_needs_sq, mem_needs_lq, is_fp_mem
+    + XLEN  # predicted_target
+    + 1  # predicted_taken
+    + XLEN  # branch_target
+)
+_S_USE_IMM = _S_RM + 3
+_S_IMM = _S_USE_IMM + 1
+_S_SRC3 = _S_IMM + XLEN
+_S_SRC2 = _S_SRC3 + FLEN
+_S_SRC1 = _S_SRC2 + FLEN
+_S_OP = _S_SRC1 + FLEN
+_S_ROB_TAG = _S_OP + OP_WIDTH
+_S_VALID = _S_ROB_TAG + ROB_TAG_WIDTH
+
+_S_LINK_ADDR = 3 + 5 + CHECKPOINT_ID_WIDTH + 1  # branch_op .. has_checkpoint
+_S_PC = _S_LINK_ADDR + XLEN
+
+# All other fields are zero except branch_op, which idles at riscv_pkg::NULL.
+_RS_ISSUE_IDLE_BITS = 7
+
+
+def pack_rs_issue_int2op(
+    valid: bool, rob_tag: int, op: int, src1_value: int, src2_value: int
+) -> int:
+    """Pack an rs_issue_t carrying only valid, rob_tag, op, and two sources.
+
+    Equivalent to pack_rs_issue() with every other field left at its
+    default, without the per-field keyword handling.
+    """
+    return (
+        _RS_ISSUE_IDLE_BITS
+        | ((src2_value & MASK64) << _S_SRC2)
+        | ((src1_value & MASK64) << _S_SRC1)
+        | ((op & MASK_OP) << _S_OP)
+        | ((rob_tag & MASK_TAG) << _S_ROB_TAG)
+        | (int(bool(valid)) << _S_VALID)
+    )
+
+
+def pack_rs_issue_alu(
+    valid: bool,
+    rob_tag: int,
+    op: int,
+    src1_value: int,
+    src2_value: int,
+    imm: int = 0,
+    use_imm: bool = False,
+    pc: int = 0,
+    link_addr: int = 0,
+) -> int:
+    """Pack an integer ALU rs_issue_t, as pack_rs_issue_int2op() plus imm/pc/link."""
+    return (
+        pack_rs_issue_int2op(valid, rob_tag, op, src1_value, src2_value)
+        | ((imm & MASK32) << _S_IMM)
+        | (int(bool(use_imm)) << _S_USE_IMM)
+        | ((pc & MASK32) << _S_PC)
+        | ((link_addr & MASK32) << _S_LINK_ADDR)
+    )
+
+
+def pack_rs_issue_fp2op(
+    valid: bool,
+    rob_tag: int,
+    op: int,
+    src1_value: int,
+    src2_value: int,
+    rm: int = 0,
+) -> int:
+    """Pack a two-source FP rs_issue_t, as pack_rs_issue_int2op() plus rm."""
+    return pack_rs_issue_int2op(valid, rob_tag, op, src1_value, src2_value) | (
+        (rm & 0x7) << _S_RM
+    )
+
+
+def pack_rs_issue_fp3op(
+    valid: bool,
+    rob_tag: int,
+    op: int,
+    src1_value: int,
+    src2_value: int,
+    src3_value: int = 0,
+    rm: int = 0,
+) -> int:
+    """Pack a three-source (FMA) rs_issue_t, as pack_rs_issue_fp2op() plus src3."""
+    return pack_rs_issue_fp2op(valid, rob_tag, op, src1_value, src2_value, rm) | (
+        (src3_value & MASK64) << _S_SRC3
+    )
+
+
+def with_rob_tag(packed: int, rob_tag: int) -> int:
+    """Return a packed rs_issue_t with its rob_tag field replaced.
+
+    Lets tests pack a repeated issue vector once and only retag it per op.
+    """
+    return (packed & ~(MASK_TAG << _S_ROB_TAG)) | ((rob_tag & MASK_TAG) << _S_ROB_TAG)
+
+
+@dataclass(frozen=True, slots=True)
+class FuComplete:
+    """Unpacked fu_complete_t sample (see unpack_fu_complete)."""
+
+    valid: bool = False
+    tag: int = 0
+    value: int = 0
+    exception: bool = False
+    exc_cause: int = 0
+    fp_flags: int = 0
+
+
+# Shared sample for an all-zero bus, the usual value while a test polls an
+# idle port.  FuComplete is frozen, so handing out one instance is safe.
+_FU_COMPLETE_IDLE = FuComplete()
+
+# Bit position of fu_complete_t.valid (the MSB); see unpack_fu_complete().
+FU_COMPLETE_VALID_BIT = FU_COMPLETE_WIDTH - 1
+
+
+def fu_complete_valid(raw: int) -> bool:
+    """Return fu_complete_t.valid without unpacking the other fields."""
+    return bool((raw >> FU_COMPLETE_VALID_BIT) & 1)
+
+
+def unpack_fu_complete(raw: int) -> FuComplete:
+    """Unpack a fu_complete_t bit vector into an FuComplete.
 
     Field order (LSB to MSB):
     fp_flags(5) | exc_cause(5) | exception(1) | value(64) | tag(5) | valid(1)
     """
+    if not raw:
+        return _FU_COMPLETE_IDLE
     bit = 0
 
     fp_flags = (raw >> bit) & 0x1F
@@ -198,14 +349,14 @@ def unpack_fu_complete(raw: int) -> dict:
     bit += ROB_TAG_WIDTH
     valid = bool((raw >> bit) & 1)
 
-    return {
-        "valid": valid,
-        "tag": tag,
-        "value": value,
-        "exception": exception,
-        "exc_cause": exc_cause,
-        "fp_flags": fp_flags,
-    }
+    return FuComplete(
+        valid=valid,
+        tag=tag,
+        value=value,
+        exception=exception,
+        exc_cause=exc_cause,
+        fp_flags=fp_flags,
+    )
 
 
 # =============================================================================
@@ -223,13 +374,30 @@ def nan_box_f32(f32_bits: int) -> int:
 # Parse instr_op_e from riscv_pkg.sv
 # =============================================================================
 
-
-def _parse_instr_op_enum() -> dict[str, int]:
+_INSTR_OP_ENUM_RE = re.compile(
+    r"typedef\s+enum\s*\{(.*?)\}\s*instr_op_e\s*;", re.DOTALL
+)
+_LINE_COMMENT_RE = re.compile(r"//.*")
+_BLOCK_COMMENT_RE = re.compile(r"/\*.*?\*/")
+# NAME = VALUE, with an optional sized/unsized base prefix (8'd5, 'hFF)
+_ENUM_EXPLICIT_RE = re.compile(
+    r"([A-Z_][A-Z0-9_]*)\s*=\s*(?:\d*'([bBdDhHoO]))?([0-9a-fA-F_]+)"
+)
+_ENUM_IMPLICIT_RE = re.compile(r"[A-Z_][A-Z0-9_]*")
+_SV_BASES = {"b": 2, "d": 10, "h": 16, "o": 8}
+
+
+@functools.cache
+def _parse_instr_op_enum() -> Mapping[str, int]:
     """Parse the instr_op_e enum from riscv_pkg.sv and return name->value map.
 
     Handles both implicit sequential values and explicit assignments
     (e.g. ``FOO = 5``, ``BAR = 32'HDEAD_BEEF``).  Raises RuntimeError
     on parse failures so silent mis-numbering cannot occur.
+
+    The result is cached, so the interface and test modules that all call
+    this at import time share one parse per process.  It is returned as a
+    read-only mapping so no caller can alter the shared copy.
     """
     pkg_path = (
         Path(__file__).resolve().parents[4]
@@ -241,32 +409,25 @@ def _parse_instr_op_enum() -> dict[str, int]:
     )
     text = pkg_path.read_text()
     # Extract the enum body between 'typedef enum {' and '} instr_op_e;'
-    m = re.search(r"typedef\s+enum\s*\{(.*?)\}\s*instr_op_e\s*;", text, re.DOTALL)
+    m = _INSTR_OP_ENUM_RE.search(text)
     if not m:
         raise RuntimeError("Could not find instr_op_e enum in riscv_pkg.sv")
     body = m.group(1)
     result: dict[str, int] = {}
     next_val = 0
     for line in body.splitlines():
-        line = re.sub(r"//.*", "", line)  # strip comments
-        line = re.sub(r"/\*.*?\*/", "", line)  # strip inline /* */
+        line = _LINE_COMMENT_RE.sub("", line)  # strip comments
+        line = _BLOCK_COMMENT_RE.sub("", line)  # strip inline /* */
         line = line.strip().rstrip(",")
         if not line:
             continue
         # NAME = VALUE  (explicit assignment)
         # Supports: plain decimal (5), sized (8'd5, 32'hFF), unsized ('hFF),
         # octal (8'o17), binary (4'b1010), with optional _ separators.
-        em = re.fullmatch(
-            r"([A-Z_][A-Z0-9_]*)\s*=\s*(?:\d*'[bBdDhHoO])?([0-9a-fA-F_]+)",
-            line,
-        )
+        em = _ENUM_EXPLICIT_RE.fullmatch(line)
         if em:
-            digits = em.group(2).replace("_", "")
-            base = 10
-            # Detect base from the format specifier preceding the digits
-            bm = re.search(r"'([bBdDhHoO])", line)
-            if bm:
-                base = {"b": 2, "d": 10, "h": 16, "o": 8}[bm.group(1).lower()]
+            digits = em.group(3).replace("_", "")
+            base = _SV_BASES[em.group(2).lower()] if em.group(2) else 10
             try:
                 next_val = int(digits, base)
             except ValueError as exc:
@@ -275,7 +436,7 @@ def _parse_instr_op_enum() -> dict[str, int]:
             next_val += 1
             continue
         # NAME  (implicit sequential)
-        if re.fullmatch(r"[A-Z_][A-Z0-9_]*", line):
+        if _ENUM_IMPLICIT_RE.fullmatch(line):
             result[line] = next_val
             next_val += 1
             continue
@@ -283,7 +444,82 @@ def _parse_instr_op_enum() -> dict[str, int]:
         raise RuntimeError(f"Cannot parse instr_op_e entry: {line!r}")
     if not result:
         raise RuntimeError("instr_op_e enum body is empty")
-    return result
+    return MappingProxyType(result)
+
+
+# =============================================================================
+# Completion Waiting
+# =============================================================================
+async def _sleep_ns(duration_ns: int) -> None:
+    await Timer(duration_ns, unit="ns")
+
+
+async def wait_for_fu_complete(
+    clock: Any, fu_complete: Any, max_cycles: int, period_ns: int
+) -> FuComplete:
+    """Wait up to max_cycles rising edges for a valid fu_complete_t.
+
+    Observes the same samples as reading the bus in ReadOnly after each
+    rising edge, but after the first edge only wakes when the packed bus
+    changes value.  Verilator does not expose packed-struct members, so
+    the whole fu_complete_t is watched and its valid bit checked on each
+    change.  The timeout is a single Timer of the remaining max_cycles - 1
+    clock periods (period_ns each), landing on the last rising edge, rather
+    than a per-edge cycle counter.  Returns the unpacked result, or the
+    last (invalid) sample if nothing completed in time.
+    """
+    await RisingEdge(clock)
+    await ReadOnly()
+    raw = int(fu_complete.value)
+    if fu_complete_valid(raw) or max_cycles <= 1:
+        return unpack_fu_complete(raw)
+
+    deadline = cocotb.start_soon(_sleep_ns((max_cycles - 1) * period_ns))
+    try:
+        while True:
+            await First(fu_complete.value_change, deadline.complete)
+            await ReadOnly()
+            raw = int(fu_complete.value)
+            if fu_complete_valid(raw) or deadline.done():
+                return unpack_fu_complete(raw)
+    finally:
+        deadline.cancel()
+
+
+async def _next_valid_fu_complete(fu_complete: Any) -> FuComplete:
+    while True:
+        await fu_complete.value_change
+        await ReadOnly()
+        raw = int(fu_complete.value)
+        if fu_complete_valid(raw):
+            return unpack_fu_complete(raw)
+
+
+async def expect_no_fu_complete(
+    fu_complete: Any, duration_ns: int, until: Trigger | None = None
+) -> None:
+    """Assert that fu_complete_t.valid stays low for the next duration_ns.
+
+    For checks that a flushed result never appears: a watcher task wakes
+    only when the packed bus changes, while the caller sleeps on a single
+    Timer instead of stepping through every clock edge.  If *until* is
+    given, the window also closes as soon as that trigger fires.
+    """
+    await ReadOnly()
+    raw = int(fu_complete.value)
+    if fu_complete_valid(raw):
+        tag = unpack_fu_complete(raw).tag
+        raise AssertionError(f"fu_complete already valid (tag={tag})")
+    watcher = cocotb.start_soon(_next_valid_fu_complete(fu_complete))
+    window_end = Timer(duration_ns, unit="ns")
+    if until is None:
+        await First(watcher.complete, window_end)
+    else:
+        await First(watcher.complete, window_end, until)
+    if watcher.done():
+        tag = watcher.result().tag
+        raise AssertionError(f"unexpected valid fu_complete (tag={tag})")
+    watcher.cancel()
 
 
 # =============================================================================
@@ -301,19 +537,31 @@ class FpAddShimInterface:
     def __init__(self, dut: Any) -> None:
         """Initialize interface with DUT handle."""
         self.dut = dut
+        # Resolve signal handles once; the methods below run every cycle.
+        self._clk = dut.i_clk
+        self._rst_n = dut.i_rst_n
+        self._rs_issue = dut.i_rs_issue
+        self._flush = dut.i_flush
+        self._flush_en = dut.i_flush_en
+        self._flush_tag = dut.i_flush_tag
+        self._rob_head_tag = dut.i_rob_head_tag
+        self._fu_complete = dut.o_fu_complete
+        self._fu_busy = dut.o_fu_busy
+        # Reusable all-zero i_rs_issue value (see FpDivShimInterface).
+        self._issue_idle = LogicArray(0, len(self._rs_issue))
 
     @property
     def clock(self) -> Any:
         """Return clock signal."""
-        return self.dut.i_clk
+        return self._clk
 
     def _init_inputs(self) -> None:
         """Drive all inputs to zero/inactive after reset."""
-        self.dut.i_rs_issue.value = 0
-        self.dut.i_flush.value = 0
-        self.dut.i_flush_en.value = 0
-        self.dut.i_flush_tag.value = 0
-        self.dut.i_rob_head_tag.value = 0
+        self._rs_issue.value = self._issue_idle
+        self._flush.value = 0
+        self._flush_en.value = 0
+        self._flush_tag.value = 0
+        self._rob_head_tag.value = 0
 
     async def reset(self, cycles: int = 3) -> None:
         """Reset the DUT for the given number of cycles.
@@ -322,19 +570,18 @@ class FpAddShimInterface:
         deasserts reset and settles on the falling edge.
         """
         self._init_inputs()
-        self.dut.i_rst_n.value = 0
+        self._rst_n.value = 0
 
-        for _ in range(cycles):
-            await RisingEdge(self.clock)
+        await ClockCycles(self._clk, cycles)
 
-        self.dut.i_rst_n.value = 1
-        await RisingEdge(self.clock)
-        await FallingEdge(self.clock)
+        self._rst_n.value = 1
+        await RisingEdge(self._clk)
+        await FallingEdge(self._clk)
 
     async def step(self) -> None:
         """Advance one cycle: rising edge then falling edge."""
-        await RisingEdge(self.clock)
-        await FallingEdge(self.clock)
+        await RisingEdge(self._clk)
+        await FallingEdge(self._clk)
 
     def drive_issue(
         self,
@@ -351,46 +598,49 @@ class FpAddShimInterface:
         Sources are marked ready since the shim expects operands to be
         available at issue time.
         """
-        packed = pack_rs_issue(
-            valid=valid,
-            rob_tag=rob_tag,
-            op=op,
-            src1_value=src1_value,
-            src2_value=src2_value,
-            src3_value=src3_value,
-            rm=rm,
+        self._rs_issue.value = pack_rs_issue_fp3op(
+            valid, rob_tag, op, src1_value, src2_value, src3_value, rm
         )
-        self.dut.i_rs_issue.value = packed
 
     def clear_issue(self) -> None:
         """Clear i_rs_issue (drive to zero / invalid)."""
-        self.dut.i_rs_issue.value = 0
+        self._rs_issue.value = self._issue_idle
+
+    @property
+    def fu_complete_handle(self) -> Any:
+        """Return the packed o_fu_complete signal handle (for value_change)."""
+        return self._fu_complete
+
+    @property
+    def busy_handle(self) -> Any:
+        """Return the o_fu_busy signal handle (for edge triggers)."""
+        return self._fu_busy
 
-    def read_fu_complete(self) -> dict:
+    def read_fu_complete(self) -> FuComplete:
         """Read and unpack the o_fu_complete output."""
-        raw = int(self.dut.o_fu_complete.value)
+        raw = int(self._fu_complete.value)
         return unpack_fu_complete(raw)
 
     def read_busy(self) -> bool:
         """Read o_fu_busy."""
-        return bool(int(self.dut.o_fu_busy.value))
+        return bool(int(self._fu_busy.value))
 
     def drive_flush(self) -> None:
         """Assert i_flush (full pipeline flush)."""
-        self.dut.i_flush.value = 1
+        self._flush.value = 1
 
     def clear_flush(self) -> None:
         """Deassert i_flush."""
-        self.dut.i_flush.value = 0
+        self._flush.value = 0
 
     def drive_partial_flush(self, flush_tag: int, head_tag: int) -> None:
         """Assert i_flush_en with tag and ROB head for age comparison."""
-        self.dut.i_flush_en.value = 1
-        self.dut.i_flush_tag.value = flush_tag & MASK_TAG
-        self.dut.i_rob_head_tag.value = head_tag & MASK_TAG
+        self._flush_en.value = 1
+        self._flush_tag.value = flush_tag & MASK_TAG
+        self._rob_head_tag.value = head_tag & MASK_TAG
 
     def clear_partial_flush(self) -> None:
         """Deassert i_flush_en and clear tag signals."""
-        self.dut.i_flush_en.value = 0
-        self.dut.i_flush_tag.value = 0
-        self.dut.i_rob_head_tag.value = 0
+        self._flush_en.value = 0
+        self._flush_tag.value = 0
+        self._rob_head_tag.value = 0
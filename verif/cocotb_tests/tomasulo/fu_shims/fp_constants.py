@@ -0,0 +1,58 @@
+#    Copyright 2026 Two Sigma Open Source, LLC
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""IEEE 754 bit patterns shared by the FP shim tests.
+
+Single-precision values are given both as raw 32-bit patterns (F32_*) and
+NaN-boxed into the 64-bit FLEN operand/result width (SP_*).  Double-precision
+values (DP_*) are plain 64-bit patterns.
+"""
+
+# NaN-boxing: upper 32 bits all-ones for single-precision in FLEN=64
+NAN_BOX = 0xFFFF_FFFF_0000_0000
+
+# ---------------------------------------------------------------------------
+# Single precision (raw)
+# ---------------------------------------------------------------------------
+F32_1_0 = 0x3F80_0000  # 1.0f
+F32_2_0 = 0x4000_0000  # 2.0f
+F32_3_0 = 0x4040_0000  # 3.0f
+F32_4_0 = 0x4080_0000  # 4.0f
+F32_5_0 = 0x40A0_0000  # 5.0f
+F32_6_0 = 0x40C0_0000  # 6.0f
+F32_7_0 = 0x40E0_0000  # 7.0f
+F32_NEG_1_0 = 0xBF80_0000  # -1.0f
+
+# ---------------------------------------------------------------------------
+# Single precision (NaN-boxed)
+# ---------------------------------------------------------------------------
+SP_1_0 = NAN_BOX | F32_1_0
+SP_2_0 = NAN_BOX | F32_2_0
+SP_3_0 = NAN_BOX | F32_3_0
+SP_4_0 = NAN_BOX | F32_4_0
+SP_5_0 = NAN_BOX | F32_5_0
+SP_6_0 = NAN_BOX | F32_6_0
+SP_7_0 = NAN_BOX | F32_7_0
+SP_NEG_1_0 = NAN_BOX | F32_NEG_1_0
+
+# ---------------------------------------------------------------------------
+# Double precision
+# ---------------------------------------------------------------------------
+DP_2_0 = 0x4000_0000_0000_0000  # 2.0
+DP_6_0 = 0x4018_0000_0000_0000  # 6.0
+DP_9_0 = 0x4022_0000_0000_0000  # 9.0
+DP_16_0 = 0x4030_0000_0000_0000  # 16.0
+DP_25_0 = 0x4039_0000_0000_0000  # 25.0
+DP_NEG_1_0 = 0xBFF0_0000_0000_0000  # -1.0
+DP_MIN_SUBNORMAL = 0x0000_0000_0000_0001  # 2^-1074
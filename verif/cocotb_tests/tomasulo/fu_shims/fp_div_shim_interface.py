@@ -17,16 +17,21 @@
 Provides clean access to fp_div_shim signals with proper typing and
 helper methods for driving stimulus and reading results.
 
-Reuses pack_rs_issue and unpack_fu_complete from the fp_add_shim
+Reuses pack_rs_issue_fp2op and unpack_fu_complete from the fp_add_shim
 interface, and _parse_instr_op_enum for op-code resolution.
 """
 
+import functools
+from collections.abc import Iterable
 from typing import Any
 
-from cocotb.triggers import FallingEdge, RisingEdge
+from cocotb.triggers import ClockCycles, FallingEdge, RisingEdge
+from cocotb.types import LogicArray
 
 from .fp_add_shim_interface import (
-    pack_rs_issue,
+    FuComplete,
+    fu_complete_valid,
+    pack_rs_issue_fp2op,
     unpack_fu_complete,
     _parse_instr_op_enum,
     MASK_TAG,
@@ -45,36 +50,61 @@ OP_FSQRT_D = _INSTR_OPS["FSQRT_D"]
 CLOCK_PERIOD_NS = 10
 
 
+@functools.lru_cache(maxsize=256)
+def _rs_issue_value(packed: int, width: int) -> LogicArray:
+    """Return a shared LogicArray for a packed i_rs_issue vector.
+
+    Repeated vectors reuse one object, and with it the bit string cocotb
+    renders on the first write (see the note on _issue_idle below).
+    """
+    return LogicArray(packed, width)
+
+
 class FpDivShimInterface:
     """Interface to the fp_div_shim DUT."""
 
     def __init__(self, dut: Any) -> None:
         """Initialize interface with DUT handle."""
         self.dut = dut
+        # Resolve signal handles once; the methods below run every cycle.
+        self._clk = dut.i_clk
+        self._rst_n = dut.i_rst_n
+        self._rs_issue = dut.i_rs_issue
+        self._flush = dut.i_flush
+        self._flush_en = dut.i_flush_en
+        self._flush_tag = dut.i_flush_tag
+        self._rob_head_tag = dut.i_rob_head_tag
+        self._div_accepted = dut.i_div_accepted
+        self._fu_complete = dut.o_fu_complete
+        self._fu_busy = dut.o_fu_busy
+        # i_rs_issue is several hundred bits wide, so an int write is
+        # re-rendered to a bit string every time.  Build the idle value once;
+        # LogicArray caches its string form after the first write.
+        self._rs_issue_width = len(self._rs_issue)
+        self._issue_idle = LogicArray(0, self._rs_issue_width)
 
     @property
     def clock(self) -> Any:
         """Return clock signal."""
-        return self.dut.i_clk
+        return self._clk
 
     def _init_inputs(self) -> None:
         """Drive all inputs to zero / safe defaults."""
-        self.dut.i_rs_issue.value = 0
-        self.dut.i_flush.value = 0
-        self.dut.i_flush_en.value = 0
-        self.dut.i_flush_tag.value = 0
-        self.dut.i_rob_head_tag.value = 0
-        self.dut.i_div_accepted.value = 0
+        self._rs_issue.value = self._issue_idle
+        self._flush.value = 0
+        self._flush_en.value = 0
+        self._flush_tag.value = 0
+        self._rob_head_tag.value = 0
+        self._div_accepted.value = 0
 
     async def reset(self, cycles: int = 3) -> None:
         """Reset the DUT for *cycles* low-reset clock edges."""
         self._init_inputs()
-        self.dut.i_rst_n.value = 0
+        self._rst_n.value = 0
 
-        for _ in range(cycles):
-            await RisingEdge(self.clock)
+        await ClockCycles(self._clk, cycles)
 
-        self.dut.i_rst_n.value = 1
+        self._rst_n.value = 1
         await RisingEdge(self.clock)
         await FallingEdge(self.clock)
 
@@ -92,52 +122,87 @@ class FpDivShimInterface:
         For FP div/sqrt the only meaningful fields are valid, rob_tag, op,
         src1_value, src2_value, and rm.  All other fields are driven as 0.
         """
-        self.dut.i_rs_issue.value = pack_rs_issue(
-            valid=valid,
-            rob_tag=rob_tag,
-            op=op,
-            src1_value=src1_value,
-            src2_value=src2_value,
-            rm=rm,
+        self._rs_issue.value = pack_rs_issue_fp2op(
+            valid, rob_tag, op, src1_value, src2_value, rm
         )
 
     def clear_issue(self) -> None:
         """Deassert i_rs_issue (all zeros)."""
-        self.dut.i_rs_issue.value = 0
+        self._rs_issue.value = self._issue_idle
+
+    async def issue_burst(self, ops: Iterable[tuple[int, int, int, int]]) -> None:
+        """Issue (rob_tag, op, src1_value, src2_value) ops on consecutive cycles.
+
+        Each op is held for one rising edge; i_rs_issue is cleared after the
+        last one.  rm is left at 0 (RNE), as the back-to-back tests use.
+        """
+        await self.issue_burst_packed(
+            pack_rs_issue_fp2op(True, rob_tag, op, src1_value, src2_value)
+            for rob_tag, op, src1_value, src2_value in ops
+        )
 
-    def read_fu_complete(self) -> dict:
-        """Unpack o_fu_complete and return as a dict."""
-        raw = int(self.dut.o_fu_complete.value)
+    def drive_issue_packed(self, packed: int) -> None:
+        """Drive a pre-packed rs_issue_t (e.g. from pack_rs_issue_fp2op)."""
+        self._rs_issue.value = _rs_issue_value(packed, self._rs_issue_width)
+
+    async def issue_burst_packed(self, vectors: Iterable[int]) -> None:
+        """Issue pre-packed rs_issue_t vectors on consecutive cycles, then clear."""
+        rs_issue = self._rs_issue
+        width = self._rs_issue_width
+        clk = self._clk
+        for packed in vectors:
+            rs_issue.value = _rs_issue_value(packed, width)
+            await RisingEdge(clk)
+        rs_issue.value = self._issue_idle
+
+    @property
+    def fu_complete_handle(self) -> Any:
+        """Return the packed o_fu_complete signal handle (for value_change)."""
+        return self._fu_complete
+
+    def read_fu_complete(self) -> FuComplete:
+        """Unpack o_fu_complete and return it as an FuComplete."""
+        raw = int(self._fu_complete.value)
         return unpack_fu_complete(raw)
 
+    def valid_asserted(self) -> bool:
+        """Return o_fu_complete.valid without unpacking the rest of the bus."""
+        return fu_complete_valid(int(self._fu_complete.value))
+
     def read_busy(self) -> bool:
         """Return the current state of o_fu_busy."""
-        return bool(int(self.dut.o_fu_busy.value))
+        return bool(int(self._fu_busy.value))
 
     def drive_flush(self) -> None:
         """Assert i_flush (full pipeline flush)."""
-        self.dut.i_flush.value = 1
+        self._flush.value = 1
 
     def clear_flush(self) -> None:
         """Deassert i_flush."""
-        self.dut.i_flush.value = 0
+        self._flush.value = 0
 
     def drive_partial_flush(self, flush_tag: int, head_tag: int) -> None:
         """Assert i_flush_en with the given tag and ROB head tag."""
-        self.dut.i_flush_en.value = 1
-        self.dut.i_flush_tag.value = flush_tag & MASK_TAG
-        self.dut.i_rob_head_tag.value = head_tag & MASK_TAG
+        self._flush_en.value = 1
+        self._flush_tag.value = flush_tag & MASK_TAG
+        self._rob_head_tag.value = head_tag & MASK_TAG
 
     def clear_partial_flush(self) -> None:
         """Deassert i_flush_en and clear tag fields."""
-        self.dut.i_flush_en.value = 0
-        self.dut.i_flush_tag.value = 0
-        self.dut.i_rob_head_tag.value = 0
+        self._flush_en.value = 0
+        self._flush_tag.value = 0
+        self._rob_head_tag.value = 0
 
     def drive_div_accepted(self) -> None:
         """Assert i_div_accepted for one cycle (pop FIFO head)."""
-        self.dut.i_div_accepted.value = 1
+        self._div_accepted.value = 1
 
     def clear_div_accepted(self) -> None:
         """Deassert i_div_accepted."""
-        self.dut.i_div_accepted.value = 0
+        self._div_accepted.value = 0
+
+    async def pulse_div_accepted(self) -> None:
+        """Hold i_div_accepted for the next rising edge, then deassert it."""
+        self.drive_div_accepted()
+        await RisingEdge(self._clk)
+        self.clear_div_accepted()
@@ -17,15 +17,21 @@
 Provides helper methods for driving rs_issue_t input, reading fu_complete_t
 output, and managing flush/reset sequences on the fp_mul_shim module.
 
-Reuses pack_rs_issue and unpack_fu_complete from the fp_add_shim_interface
+Reuses pack_rs_issue_fp3op and unpack_fu_complete from the fp_add_shim_interface
 to avoid duplicating struct packing logic.
 """
 
 from typing import Any
 
-from cocotb.triggers import FallingEdge, RisingEdge
+from cocotb.triggers import ClockCycles, FallingEdge, RisingEdge
+from cocotb.types import LogicArray
 
-from .fp_add_shim_interface import pack_rs_issue, unpack_fu_complete
+from .fp_add_shim_interface import (
+    FuComplete,
+    fu_complete_valid,
+    pack_rs_issue_fp3op,
+    unpack_fu_complete,
+)
 
 # Width constants
 ROB_TAG_WIDTH = 5
@@ -38,27 +44,39 @@ class FpMulShimInterface:
     def __init__(self, dut: Any) -> None:
         """Initialize interface with DUT handle."""
         self.dut = dut
+        # Resolve signal handles once; the methods below run every cycle.
+        self._clk = dut.i_clk
+        self._rst_n = dut.i_rst_n
+        self._rs_issue = dut.i_rs_issue
+        self._flush = dut.i_flush
+        self._flush_en = dut.i_flush_en
+        self._flush_tag = dut.i_flush_tag
+        self._rob_head_tag = dut.i_rob_head_tag
+        self._mul_accepted = dut.i_mul_accepted
+        self._fu_complete = dut.o_fu_complete
+        self._fu_busy = dut.o_fu_busy
+        # Reusable all-zero i_rs_issue value (see FpDivShimInterface).
+        self._issue_idle = LogicArray(0, len(self._rs_issue))
 
     def _init_inputs(self) -> None:
         """Drive all inputs to zero."""
-        self.dut.i_rs_issue.value = 0
-        self.dut.i_flush.value = 0
-        self.dut.i_flush_en.value = 0
-        self.dut.i_flush_tag.value = 0
-        self.dut.i_rob_head_tag.value = 0
-        self.dut.i_mul_accepted.value = 1
+        self._rs_issue.value = self._issue_idle
+        self._flush.value = 0
+        self._flush_en.value = 0
+        self._flush_tag.value = 0
+        self._rob_head_tag.value = 0
+        self._mul_accepted.value = 1
 
     async def reset(self, cycles: int = 3) -> None:
         """Reset sequence: assert i_rst_n low, hold for *cycles*, then release."""
         self._init_inputs()
-        self.dut.i_rst_n.value = 0
+        self._rst_n.value = 0
 
-        for _ in range(cycles):
-            await RisingEdge(self.dut.i_clk)
+        await ClockCycles(self._clk, cycles)
 
-        self.dut.i_rst_n.value = 1
-        await RisingEdge(self.dut.i_clk)
-        await FallingEdge(self.dut.i_clk)
+        self._rst_n.value = 1
+        await RisingEdge(self._clk)
+        await FallingEdge(self._clk)
 
     def drive_issue(
         self,
@@ -71,41 +89,48 @@ class FpMulShimInterface:
         rm: int = 0,
     ) -> None:
         """Drive i_rs_issue with the given fields (packs into rs_issue_t)."""
-        self.dut.i_rs_issue.value = pack_rs_issue(
-            valid=valid,
-            rob_tag=rob_tag,
-            op=op,
-            src1_value=src1_value,
-            src2_value=src2_value,
-            src3_value=src3_value,
-            rm=rm,
+        self._rs_issue.value = pack_rs_issue_fp3op(
+            valid, rob_tag, op, src1_value, src2_value, src3_value, rm
         )
 
-    def read_fu_complete(self) -> dict:
-        """Unpack and return the o_fu_complete output as a dict."""
-        raw = int(self.dut.o_fu_complete.value)
+    def clear_issue(self) -> None:
+        """Deassert i_rs_issue (all zeros)."""
+        self._rs_issue.value = self._issue_idle
+
+    @property
+    def fu_complete_handle(self) -> Any:
+        """Return the packed o_fu_complete signal handle (for value_change)."""
+        return self._fu_complete
+
+    def read_fu_complete(self) -> FuComplete:
+        """Unpack and return the o_fu_complete output as an FuComplete."""
+        raw = int(self._fu_complete.value)
         return unpack_fu_complete(raw)
 
+    def valid_asserted(self) -> bool:
+        """Return o_fu_complete.valid without unpacking the rest of the bus."""
+        return fu_complete_valid(int(self._fu_complete.value))
+
     def read_busy(self) -> bool:
         """Return the current value of o_fu_busy."""
-        return bool(int(self.dut.o_fu_busy.value))
+        return bool(int(self._fu_busy.value))
 
     def drive_flush(self) -> None:
         """Assert i_flush (full flush)."""
-        self.dut.i_flush.value = 1
+        self._flush.value = 1
 
     def clear_flush(self) -> None:
         """Deassert i_flush."""
-        self.dut.i_flush.value = 0
+        self._flush.value = 0
 
     def drive_partial_flush(self, flush_tag: int, head_tag: int) -> None:
         """Assert i_flush_en with tag and ROB head for age comparison."""
-        self.dut.i_flush_en.value = 1
-        self.dut.i_flush_tag.value = flush_tag & MASK_TAG
-        self.dut.i_rob_head_tag.value = head_tag & MASK_TAG
+        self._flush_en.value = 1
+        self._flush_tag.value = flush_tag & MASK_TAG
+        self._rob_head_tag.value = head_tag & MASK_TAG
 
     def clear_partial_flush(self) -> None:
         """Deassert i_flush_en and clear tag signals."""
-        self.dut.i_flush_en.value = 0
-        self.dut.i_flush_tag.value = 0
-        self.dut.i_rob_head_tag.value = 0
+        self._flush_en.value = 0
+        self._flush_tag.value = 0
+        self._rob_head_tag.value = 0
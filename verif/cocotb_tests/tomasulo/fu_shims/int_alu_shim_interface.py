@@ -23,23 +23,21 @@ i_csr_read_data for CSR read operations.
 
 from typing import Any
 
-from cocotb.triggers import FallingEdge, RisingEdge
+from cocotb.triggers import ClockCycles, FallingEdge, RisingEdge
+from cocotb.types import LogicArray
 
 from .fp_add_shim_interface import (
+    FuComplete,
     _parse_instr_op_enum,
-    pack_rs_issue,
+    pack_rs_issue_alu,
     unpack_fu_complete,
 )
 
-_INSTR_OP = _parse_instr_op_enum()
-_BRANCH_OPS = {
-    _INSTR_OP["BEQ"],
-    _INSTR_OP["BNE"],
-    _INSTR_OP["BLT"],
-    _INSTR_OP["BGE"],
-    _INSTR_OP["BLTU"],
-    _INSTR_OP["BGEU"],
-}
+_INSTR_OPS = _parse_instr_op_enum()
+# Conditional branches issue without the CDB writeback hint (drive_issue).
+_BRANCH_OPS = frozenset(
+    _INSTR_OPS[name] for name in ("BEQ", "BNE", "BLT", "BGE", "BLTU", "BGEU")
+)
 
 
 class IntAluShimInterface:
@@ -48,17 +46,27 @@ class IntAluShimInterface:
     def __init__(self, dut: Any) -> None:
         """Initialize interface with DUT handle."""
         self.dut = dut
+        # Resolve signal handles once; the methods below run every cycle.
+        self._clk = dut.i_clk
+        self._rst_n = dut.i_rst_n
+        self._rs_issue = dut.i_rs_issue
+        self._issue_writes_cdb_hint = dut.i_issue_writes_cdb_hint
+        self._csr_read_data = dut.i_csr_read_data
+        self._fu_complete = dut.o_fu_complete
+        self._fu_busy = dut.o_fu_busy
+        # Reusable all-zero i_rs_issue value (see FpDivShimInterface).
+        self._issue_idle = LogicArray(0, len(self._rs_issue))
 
     @property
     def clock(self) -> Any:
         """Return clock signal."""
-        return self.dut.i_clk
+        return self._clk
 
     def _init_inputs(self) -> None:
         """Drive all inputs to zero / inactive."""
-        self.dut.i_rs_issue.value = 0
-        self.dut.i_issue_writes_cdb_hint.value = 0
-        self.dut.i_csr_read_data.value = 0
+        self._rs_issue.value = self._issue_idle
+        self._issue_writes_cdb_hint.value = 0
+        self._csr_read_data.value = 0
 
     async def reset(self, cycles: int = 3) -> None:
         """Reset the DUT for the given number of cycles.
@@ -67,19 +75,18 @@ class IntAluShimInterface:
         deasserts reset and settles on the falling edge.
         """
         self._init_inputs()
-        self.dut.i_rst_n.value = 0
+        self._rst_n.value = 0
 
-        for _ in range(cycles):
-            await RisingEdge(self.clock)
+        await ClockCycles(self._clk, cycles)
 
-        self.dut.i_rst_n.value = 1
-        await RisingEdge(self.clock)
-        await FallingEdge(self.clock)
+        self._rst_n.value = 1
+        await RisingEdge(self._clk)
+        await FallingEdge(self._clk)
 
     async def step(self) -> None:
         """Advance one cycle: rising edge then falling edge."""
-        await RisingEdge(self.clock)
-        await FallingEdge(self.clock)
+        await RisingEdge(self._clk)
+        await FallingEdge(self._clk)
 
     def drive_issue(
         self,
@@ -98,30 +105,22 @@ class IntAluShimInterface:
         Exposes imm, use_imm, pc, and link_addr which the ALU shim uses for
         immediate operations, LUI/AUIPC, and JAL/JALR link results.
         """
-        packed = pack_rs_issue(
-            valid=valid,
-            rob_tag=rob_tag,
-            op=op,
-            src1_value=src1_value,
-            src2_value=src2_value,
-            imm=imm,
-            use_imm=use_imm,
-            pc=pc,
-            link_addr=link_addr,
+        packed = pack_rs_issue_alu(
+            valid, rob_tag, op, src1_value, src2_value, imm, use_imm, pc, link_addr
         )
-        self.dut.i_rs_issue.value = packed
-        self.dut.i_issue_writes_cdb_hint.value = 0 if op in _BRANCH_OPS else 1
+        self._rs_issue.value = packed
+        self._issue_writes_cdb_hint.value = 0 if op in _BRANCH_OPS else 1
 
     def clear_issue(self) -> None:
         """Clear i_rs_issue (drive to zero / invalid)."""
-        self.dut.i_rs_issue.value = 0
-        self.dut.i_issue_writes_cdb_hint.value = 0
+        self._rs_issue.value = self._issue_idle
+        self._issue_writes_cdb_hint.value = 0
 
-    def read_fu_complete(self) -> dict:
+    def read_fu_complete(self) -> FuComplete:
         """Read and unpack the o_fu_complete output."""
-        raw = int(self.dut.o_fu_complete.value)
+        raw = int(self._fu_complete.value)
         return unpack_fu_complete(raw)
 
     def read_busy(self) -> bool:
         """Read o_fu_busy."""
-        return bool(int(self.dut.o_fu_busy.value))
+        return bool(int(self._fu_busy.value))
@@ -14,7 +14,7 @@
 
 """DUT interface for int_muldiv_shim verification.
 
-Reuses pack_rs_issue and unpack_fu_complete from fp_add_shim_interface
+Reuses pack_rs_issue_int2op and unpack_fu_complete from fp_add_shim_interface
 to avoid duplicating struct packing logic.
 
 The MUL/DIV shim has two output ports (o_mul_fu_complete, o_div_fu_complete)
@@ -23,9 +23,15 @@ and supports full and partial flush.
 
 from typing import Any
 
-from cocotb.triggers import FallingEdge, RisingEdge
+from cocotb.triggers import ClockCycles, FallingEdge, RisingEdge
+from cocotb.types import LogicArray
 
-from .fp_add_shim_interface import pack_rs_issue, unpack_fu_complete, MASK_TAG
+from .fp_add_shim_interface import (
+    FuComplete,
+    pack_rs_issue_int2op,
+    unpack_fu_complete,
+    MASK_TAG,
+)
 
 
 class IntMulDivShimInterface:
@@ -34,20 +40,41 @@ class IntMulDivShimInterface:
     def __init__(self, dut: Any) -> None:
         """Initialize interface with DUT handle."""
         self.dut = dut
+        # Resolve signal handles once; the methods below run every cycle.
+        self._clk = dut.i_clk
+        self._rst_n = dut.i_rst_n
+        self._rs_issue = dut.i_rs_issue
+        self._flush = dut.i_flush
+        self._flush_en = dut.i_flush_en
+        self._flush_tag = dut.i_flush_tag
+        self._rob_head_tag = dut.i_rob_head_tag
+        self._mul_accepted = dut.i_mul_accepted
+        self._div_accepted = dut.i_div_accepted
+        self._mul_fu_complete = dut.o_mul_fu_complete
+        self._div_fu_complete = dut.o_div_fu_complete
+        self._fu_busy = dut.o_fu_busy
+        # Reusable all-zero i_rs_issue value (see FpDivShimInterface).
+        self._issue_idle = LogicArray(0, len(self._rs_issue))
 
     @property
     def clock(self) -> Any:
         """Return clock signal."""
-        return self.dut.i_clk
+        return self._clk
 
     def _init_inputs(self) -> None:
-        """Drive all inputs to zero / inactive."""
-        self.dut.i_rs_issue.value = 0
-        self.dut.i_flush.value = 0
-        self.dut.i_flush_en.value = 0
-        self.dut.i_flush_tag.value = 0
-        self.dut.i_rob_head_tag.value = 0
-        self.dut.i_div_accepted.value = 0
+        """Drive all inputs to zero / inactive.
+
+        i_mul_accepted is the exception: like the fp_mul adapter, the MUL
+        consumer is modelled as always ready, so MUL results pop as soon as
+        they reach the FIFO head.  DIV pops stay under test control.
+        """
+        self._rs_issue.value = self._issue_idle
+        self._flush.value = 0
+        self._flush_en.value = 0
+        self._flush_tag.value = 0
+        self._rob_head_tag.value = 0
+        self._mul_accepted.value = 1
+        self._div_accepted.value = 0
 
     async def reset(self, cycles: int = 3) -> None:
         """Reset the DUT for the given number of cycles.
@@ -56,19 +83,18 @@ class IntMulDivShimInterface:
         deasserts reset and settles on the falling edge.
         """
         self._init_inputs()
-        self.dut.i_rst_n.value = 0
+        self._rst_n.value = 0
 
-        for _ in range(cycles):
-            await RisingEdge(self.clock)
+        await ClockCycles(self._clk, cycles)
 
-        self.dut.i_rst_n.value = 1
-        await RisingEdge(self.clock)
-        await FallingEdge(self.clock)
+        self._rst_n.value = 1
+        await RisingEdge(self._clk)
+        await FallingEdge(self._clk)
 
     async def step(self) -> None:
         """Advance one cycle: rising edge then falling edge."""
-        await RisingEdge(self.clock)
-        await FallingEdge(self.clock)
+        await RisingEdge(self._clk)
+        await FallingEdge(self._clk)
 
     def drive_issue(
         self,
@@ -79,57 +105,68 @@ class IntMulDivShimInterface:
         src2_value: int,
     ) -> None:
         """Pack and drive an rs_issue_t onto i_rs_issue."""
-        packed = pack_rs_issue(
-            valid=valid,
-            rob_tag=rob_tag,
-            op=op,
-            src1_value=src1_value,
-            src2_value=src2_value,
+        self._rs_issue.value = pack_rs_issue_int2op(
+            valid, rob_tag, op, src1_value, src2_value
         )
-        self.dut.i_rs_issue.value = packed
 
     def clear_issue(self) -> None:
         """Clear i_rs_issue (drive to zero / invalid)."""
-        self.dut.i_rs_issue.value = 0
+        self._rs_issue.value = self._issue_idle
+
+    @property
+    def mul_fu_complete_handle(self) -> Any:
+        """Return the packed o_mul_fu_complete signal handle (for value_change)."""
+        return self._mul_fu_complete
 
-    def read_mul_fu_complete(self) -> dict:
+    @property
+    def div_fu_complete_handle(self) -> Any:
+        """Return the packed o_div_fu_complete signal handle (for value_change)."""
+        return self._div_fu_complete
+
+    def read_mul_fu_complete(self) -> FuComplete:
         """Read and unpack the o_mul_fu_complete output."""
-        raw = int(self.dut.o_mul_fu_complete.value)
+        raw = int(self._mul_fu_complete.value)
         return unpack_fu_complete(raw)
 
-    def read_div_fu_complete(self) -> dict:
+    def read_div_fu_complete(self) -> FuComplete:
         """Read and unpack the o_div_fu_complete output."""
-        raw = int(self.dut.o_div_fu_complete.value)
+        raw = int(self._div_fu_complete.value)
         return unpack_fu_complete(raw)
 
     def read_busy(self) -> bool:
         """Read o_fu_busy."""
-        return bool(int(self.dut.o_fu_busy.value))
+        return bool(int(self._fu_busy.value))
 
     def drive_flush(self) -> None:
         """Assert i_flush (full pipeline flush)."""
-        self.dut.i_flush.value = 1
+        self._flush.value = 1
 
     def clear_flush(self) -> None:
         """Deassert i_flush."""
-        self.dut.i_flush.value = 0
+        self._flush.value = 0
 
     def drive_partial_flush(self, flush_tag: int, head_tag: int) -> None:
         """Assert i_flush_en with tag and ROB head for age comparison."""
-        self.dut.i_flush_en.value = 1
-        self.dut.i_flush_tag.value = flush_tag & MASK_TAG
-        self.dut.i_rob_head_tag.value = head_tag & MASK_TAG
+        self._flush_en.value = 1
+        self._flush_tag.value = flush_tag & MASK_TAG
+        self._rob_head_tag.value = head_tag & MASK_TAG
 
     def clear_partial_flush(self) -> None:
         """Deassert i_flush_en and clear tag signals."""
-        self.dut.i_flush_en.value = 0
-        self.dut.i_flush_tag.value = 0
-        self.dut.i_rob_head_tag.value = 0
+        self._flush_en.value = 0
+        self._flush_tag.value = 0
+        self._rob_head_tag.value = 0
 
     def drive_div_accepted(self) -> None:
         """Assert i_div_accepted for one cycle (pop FIFO head)."""
-        self.dut.i_div_accepted.value = 1
+        self._div_accepted.value = 1
 
     def clear_div_accepted(self) -> None:
         """Deassert i_div_accepted."""
-        self.dut.i_div_accepted.value = 0
+        self._div_accepted.value = 0
+
+    async def pulse_div_accepted(self) -> None:
+        """Hold i_div_accepted for the next rising edge, then deassert it."""
+        self.drive_div_accepted()
+        await RisingEdge(self._clk)
+        self.clear_div_accepted()
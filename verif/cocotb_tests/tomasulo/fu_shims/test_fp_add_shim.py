@@ -18,18 +18,20 @@ Tests FP add/sub, compare, classify, sign-injection operations, busy
 signalling, and flush behavior through the shim interface.
 """
 
-import re
-from pathlib import Path
 from typing import Any
 
 import cocotb
 from cocotb.clock import Clock
-from cocotb.triggers import FallingEdge, RisingEdge
+from cocotb.triggers import FallingEdge, ReadOnly, RisingEdge
 
 from .fp_add_shim_interface import (
     FpAddShimInterface,
-    nan_box_f32,
+    FuComplete,
+    _parse_instr_op_enum,
+    expect_no_fu_complete,
+    wait_for_fu_complete,
 )
+from .fp_constants import SP_1_0, SP_2_0, SP_3_0, SP_NEG_1_0
 
 CLOCK_PERIOD_NS = 10
 
@@ -37,116 +39,53 @@ CLOCK_PERIOD_NS = 10
 # declaring a timeout.
 MAX_LATENCY = 50
 
-# ---------------------------------------------------------------------------
-# IEEE 754 single-precision bit patterns
-# ---------------------------------------------------------------------------
-F32_1_0 = 0x3F80_0000  # 1.0f
-F32_2_0 = 0x4000_0000  # 2.0f
-F32_3_0 = 0x4040_0000  # 3.0f
-F32_NEG_1_0 = 0xBF80_0000  # -1.0f
-
-# NaN-boxed versions (upper 32 bits = 0xFFFFFFFF)
-FLEN_1_0 = nan_box_f32(F32_1_0)
-FLEN_2_0 = nan_box_f32(F32_2_0)
-FLEN_3_0 = nan_box_f32(F32_3_0)
-FLEN_NEG_1_0 = nan_box_f32(F32_NEG_1_0)
-
-
-# ---------------------------------------------------------------------------
-# Parse instr_op_e from riscv_pkg.sv so op values track the RTL source.
-# ---------------------------------------------------------------------------
-def _parse_instr_op_enum() -> dict[str, int]:
-    """Parse the instr_op_e enum from riscv_pkg.sv and return name->value map.
-
-    Handles both implicit sequential values and explicit assignments
-    (e.g. ``FOO = 5``, ``BAR = 32'HDEAD_BEEF``).  Raises RuntimeError
-    on parse failures so silent mis-numbering cannot occur.
-    """
-    pkg_path = (
-        Path(__file__).resolve().parents[4]
-        / "hw"
-        / "rtl"
-        / "cpu_and_mem"
-        / "cpu"
-        / "riscv_pkg.sv"
-    )
-    text = pkg_path.read_text()
-    # Extract the enum body between 'typedef enum {' and '} instr_op_e;'
-    m = re.search(r"typedef\s+enum\s*\{(.*?)\}\s*instr_op_e\s*;", text, re.DOTALL)
-    if not m:
-        raise RuntimeError("Could not find instr_op_e enum in riscv_pkg.sv")
-    body = m.group(1)
-    result: dict[str, int] = {}
-    next_val = 0
-    for line in body.splitlines():
-        line = re.sub(r"//.*", "", line)  # strip comments
-        line = re.sub(r"/\*.*?\*/", "", line)  # strip inline /* */
-        line = line.strip().rstrip(",")
-        if not line:
-            continue
-        # NAME = VALUE  (explicit assignment)
-        # Supports: plain decimal (5), sized (8'd5, 32'hFF), unsized ('hFF),
-        # octal (8'o17), binary (4'b1010), with optional _ separators.
-        em = re.fullmatch(
-            r"([A-Z_][A-Z0-9_]*)\s*=\s*(?:\d*'[bBdDhHoO])?([0-9a-fA-F_]+)",
-            line,
-        )
-        if em:
-            digits = em.group(2).replace("_", "")
-            base = 10
-            # Detect base from the format specifier preceding the digits
-            bm = re.search(r"'([bBdDhHoO])", line)
-            if bm:
-                base = {"b": 2, "d": 10, "h": 16, "o": 8}[bm.group(1).lower()]
-            try:
-                next_val = int(digits, base)
-            except ValueError as exc:
-                raise RuntimeError(f"Cannot parse instr_op_e value: {line!r}") from exc
-            result[em.group(1)] = next_val
-            next_val += 1
-            continue
-        # NAME  (implicit sequential)
-        if re.fullmatch(r"[A-Z_][A-Z0-9_]*", line):
-            result[line] = next_val
-            next_val += 1
-            continue
-        # Unrecognised non-blank line inside the enum -- fail loudly
-        raise RuntimeError(f"Cannot parse instr_op_e entry: {line!r}")
-    if not result:
-        raise RuntimeError("instr_op_e enum body is empty")
-    return result
-
-
 _INSTR_OPS = _parse_instr_op_enum()
 
-
-def _op(name: str) -> int:
-    """Look up an instr_op_e value by name, raising KeyError on mismatch."""
-    return _INSTR_OPS[name]
+OP_FADD_S = _INSTR_OPS["FADD_S"]
+OP_FCLASS_S = _INSTR_OPS["FCLASS_S"]
+OP_FEQ_S = _INSTR_OPS["FEQ_S"]
+OP_FMAX_D = _INSTR_OPS["FMAX_D"]
+OP_FMIN_D = _INSTR_OPS["FMIN_D"]
+OP_FSGNJ_S = _INSTR_OPS["FSGNJ_S"]
+OP_FSUB_S = _INSTR_OPS["FSUB_S"]
 
 
 # ---------------------------------------------------------------------------
 # Common setup helper
 # ---------------------------------------------------------------------------
+# Built once per simulator run; see test_int_muldiv_shim.py for why the
+# clock is still started (and the DUT reset) per test.
+_iface: FpAddShimInterface | None = None
+
+
 async def setup(dut: Any) -> FpAddShimInterface:
-    """Start clock, reset DUT, and return the interface."""
-    cocotb.start_soon(Clock(dut.i_clk, CLOCK_PERIOD_NS, unit="ns").start())
-    iface = FpAddShimInterface(dut)
-    await iface.reset()
-    return iface
+    """Start clock, reset DUT, and return the shared interface."""
+    global _iface
+    cocotb.start_soon(Clock(dut.i_clk, CLOCK_PERIOD_NS, unit="ns", impl="gpi").start())
+    if _iface is None or _iface.dut is not dut:
+        _iface = FpAddShimInterface(dut)
+    await _iface.reset()
+    return _iface
 
 
-async def wait_for_complete(iface: FpAddShimInterface) -> dict:
+async def wait_for_valid_result(iface: FpAddShimInterface) -> FuComplete:
     """Wait until o_fu_complete.valid is asserted, then return the result.
 
     Raises AssertionError if the result does not arrive within MAX_LATENCY
     cycles.
     """
-    for cycle in range(MAX_LATENCY):
-        await FallingEdge(iface.clock)
-        result = iface.read_fu_complete()
-        if result["valid"]:
-            return result
+    # The first sample is the next falling edge, which may still be in the
+    # issue cycle; after that, only wake when o_fu_complete changes.
+    await FallingEdge(iface.clock)
+    result = iface.read_fu_complete()
+    if result.valid:
+        return result
+    result = await wait_for_fu_complete(
+        iface.clock, iface.fu_complete_handle, MAX_LATENCY - 1, CLOCK_PERIOD_NS
+    )
+    await FallingEdge(iface.clock)
+    if result.valid:
+        return result
     raise AssertionError(f"fu_complete.valid not asserted within {MAX_LATENCY} cycles")
 
 
@@ -159,7 +98,7 @@ async def test_reset_state(dut: Any) -> None:
     iface = await setup(dut)
 
     result = iface.read_fu_complete()
-    assert result["valid"] is False, "fu_complete.valid should be 0 after reset"
+    assert result.valid is False, "fu_complete.valid should be 0 after reset"
     assert iface.read_busy() is False, "fu_busy should be 0 after reset"
 
 
@@ -175,24 +114,22 @@ async def test_fadd_s_basic(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=rob_tag,
-        op=_op("FADD_S"),
-        src1_value=FLEN_1_0,
-        src2_value=FLEN_2_0,
+        op=OP_FADD_S,
+        src1_value=SP_1_0,
+        src2_value=SP_2_0,
         rm=0,
     )
     await RisingEdge(iface.clock)
     iface.clear_issue()
 
-    result = await wait_for_complete(iface)
+    result = await wait_for_valid_result(iface)
 
-    expected = nan_box_f32(F32_3_0)
-    assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert result["value"] == expected, (
-        f"value mismatch: got 0x{result['value']:016X}, " f"expected 0x{expected:016X}"
+    expected = SP_3_0
+    assert result.tag == rob_tag, f"tag mismatch: got {result.tag}, expected {rob_tag}"
+    assert result.value == expected, (
+        f"value mismatch: got 0x{result.value:016X}, " f"expected 0x{expected:016X}"
     )
-    assert result["exception"] is False, "unexpected exception"
+    assert result.exception is False, "unexpected exception"
 
 
 # ============================================================================
@@ -207,24 +144,22 @@ async def test_fsub_s_basic(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=rob_tag,
-        op=_op("FSUB_S"),
-        src1_value=FLEN_3_0,
-        src2_value=FLEN_1_0,
+        op=OP_FSUB_S,
+        src1_value=SP_3_0,
+        src2_value=SP_1_0,
         rm=0,
     )
     await RisingEdge(iface.clock)
     iface.clear_issue()
 
-    result = await wait_for_complete(iface)
+    result = await wait_for_valid_result(iface)
 
-    expected = nan_box_f32(F32_2_0)
-    assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert result["value"] == expected, (
-        f"value mismatch: got 0x{result['value']:016X}, " f"expected 0x{expected:016X}"
+    expected = SP_2_0
+    assert result.tag == rob_tag, f"tag mismatch: got {result.tag}, expected {rob_tag}"
+    assert result.value == expected, (
+        f"value mismatch: got 0x{result.value:016X}, " f"expected 0x{expected:016X}"
     )
-    assert result["exception"] is False, "unexpected exception"
+    assert result.exception is False, "unexpected exception"
 
 
 # ============================================================================
@@ -238,9 +173,9 @@ async def test_busy_during_operation(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=3,
-        op=_op("FADD_S"),
-        src1_value=FLEN_1_0,
-        src2_value=FLEN_2_0,
+        op=OP_FADD_S,
+        src1_value=SP_1_0,
+        src2_value=SP_2_0,
         rm=0,
     )
     await RisingEdge(iface.clock)
@@ -252,8 +187,7 @@ async def test_busy_during_operation(dut: Any) -> None:
     assert busy_seen is True, "fu_busy should be 1 while operation is in-flight"
 
     # Wait for completion
-    result = await wait_for_complete(iface)
-    assert result["valid"] is True
+    await wait_for_valid_result(iface)
 
     # After the result is produced, busy should drop on the next cycle
     await RisingEdge(iface.clock)
@@ -272,9 +206,9 @@ async def test_flush_clears_inflight(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=4,
-        op=_op("FADD_S"),
-        src1_value=FLEN_1_0,
-        src2_value=FLEN_2_0,
+        op=OP_FADD_S,
+        src1_value=SP_1_0,
+        src2_value=SP_2_0,
         rm=0,
     )
     await RisingEdge(iface.clock)
@@ -284,7 +218,6 @@ async def test_flush_clears_inflight(dut: Any) -> None:
     iface.drive_flush()
     await RisingEdge(iface.clock)
     iface.clear_flush()
-    await FallingEdge(iface.clock)
 
     # The underlying subunit still runs to completion even after flush;
     # in_flight (and thus o_fu_busy) only clears once the subunit finishes.
@@ -292,20 +225,18 @@ async def test_flush_clears_inflight(dut: Any) -> None:
     # subunit to complete before busy drops.
 
     # Wait for busy to drop (subunit finishes), verify no valid output appears
-    for _ in range(MAX_LATENCY):
-        result = iface.read_fu_complete()
-        assert result["valid"] is False, "fu_complete.valid should remain 0 after flush"
-        if not iface.read_busy():
-            break
-        await RisingEdge(iface.clock)
-        await FallingEdge(iface.clock)
-    else:
-        raise AssertionError(
-            f"fu_busy did not drop within {MAX_LATENCY} cycles after flush"
-        )
-
-    # Confirm busy is 0 now
-    assert iface.read_busy() is False, "fu_busy should be 0 after subunit completes"
+    await expect_no_fu_complete(
+        iface.fu_complete_handle,
+        MAX_LATENCY * CLOCK_PERIOD_NS,
+        until=FallingEdge(iface.busy_handle),
+    )
+    await ReadOnly()
+    assert (
+        iface.read_fu_complete().valid is False
+    ), "fu_complete.valid should remain 0 after flush"
+    assert (
+        iface.read_busy() is False
+    ), f"fu_busy did not drop within {MAX_LATENCY} cycles after flush"
 
 
 # ============================================================================
@@ -320,24 +251,20 @@ async def test_feq_s_equal(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=rob_tag,
-        op=_op("FEQ_S"),
-        src1_value=FLEN_1_0,
-        src2_value=FLEN_1_0,
+        op=OP_FEQ_S,
+        src1_value=SP_1_0,
+        src2_value=SP_1_0,
         rm=0,
     )
     await RisingEdge(iface.clock)
     iface.clear_issue()
 
-    result = await wait_for_complete(iface)
+    result = await wait_for_valid_result(iface)
 
-    assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
+    assert result.tag == rob_tag, f"tag mismatch: got {result.tag}, expected {rob_tag}"
     # FEQ returns an integer 0 or 1 (not NaN-boxed); result is XLEN value
-    assert (
-        result["value"] == 1
-    ), f"FEQ_S(1.0, 1.0) should be 1, got 0x{result['value']:016X}"
-    assert result["exception"] is False, "unexpected exception"
+    assert result.value == 1, f"FEQ_S(1.0, 1.0) should be 1, got 0x{result.value:016X}"
+    assert result.exception is False, "unexpected exception"
 
 
 # ============================================================================
@@ -352,26 +279,23 @@ async def test_fclass_s_positive_normal(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=rob_tag,
-        op=_op("FCLASS_S"),
-        src1_value=FLEN_1_0,
+        op=OP_FCLASS_S,
+        src1_value=SP_1_0,
         src2_value=0,
         rm=0,
     )
     await RisingEdge(iface.clock)
     iface.clear_issue()
 
-    result = await wait_for_complete(iface)
+    result = await wait_for_valid_result(iface)
 
-    assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
+    assert result.tag == rob_tag, f"tag mismatch: got {result.tag}, expected {rob_tag}"
     # FCLASS bit 6 = positive normal number
     expected_class = 0x40
-    assert result["value"] == expected_class, (
-        f"FCLASS_S(1.0) should be 0x{expected_class:X}, "
-        f"got 0x{result['value']:016X}"
+    assert result.value == expected_class, (
+        f"FCLASS_S(1.0) should be 0x{expected_class:X}, " f"got 0x{result.value:016X}"
     )
-    assert result["exception"] is False, "unexpected exception"
+    assert result.exception is False, "unexpected exception"
 
 
 # ============================================================================
@@ -386,27 +310,24 @@ async def test_fsgnj_s(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=rob_tag,
-        op=_op("FSGNJ_S"),
-        src1_value=FLEN_1_0,
-        src2_value=FLEN_NEG_1_0,
+        op=OP_FSGNJ_S,
+        src1_value=SP_1_0,
+        src2_value=SP_NEG_1_0,
         rm=0,
     )
     await RisingEdge(iface.clock)
     iface.clear_issue()
 
-    result = await wait_for_complete(iface)
+    result = await wait_for_valid_result(iface)
 
     # FSGNJ takes magnitude of rs1 and sign of rs2
     # magnitude(1.0) = 0x3F800000, sign(-1.0) = 1 -> -1.0 = 0xBF800000
-    expected = nan_box_f32(F32_NEG_1_0)
-    assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert result["value"] == expected, (
-        f"FSGNJ_S(1.0, -1.0) should be 0x{expected:016X}, "
-        f"got 0x{result['value']:016X}"
+    expected = SP_NEG_1_0
+    assert result.tag == rob_tag, f"tag mismatch: got {result.tag}, expected {rob_tag}"
+    assert result.value == expected, (
+        f"FSGNJ_S(1.0, -1.0) should be 0x{expected:016X}, " f"got 0x{result.value:016X}"
     )
-    assert result["exception"] is False, "unexpected exception"
+    assert result.exception is False, "unexpected exception"
 
 
 # ============================================================================
@@ -423,7 +344,7 @@ async def test_fmax_d_snan_sets_invalid(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=rob_tag,
-        op=_op("FMAX_D"),
+        op=OP_FMAX_D,
         src1_value=snan_d,
         src2_value=one_d,
         rm=0,
@@ -431,18 +352,16 @@ async def test_fmax_d_snan_sets_invalid(dut: Any) -> None:
     await RisingEdge(iface.clock)
     iface.clear_issue()
 
-    result = await wait_for_complete(iface)
+    result = await wait_for_valid_result(iface)
 
-    assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert result["value"] == one_d, (
-        f"FMAX_D(sNaN, 1.0) should be 0x{one_d:016X}, " f"got 0x{result['value']:016X}"
+    assert result.tag == rob_tag, f"tag mismatch: got {result.tag}, expected {rob_tag}"
+    assert result.value == one_d, (
+        f"FMAX_D(sNaN, 1.0) should be 0x{one_d:016X}, " f"got 0x{result.value:016X}"
     )
     assert (
-        result["fp_flags"] == 0x10
-    ), f"FMAX_D(sNaN, 1.0) should raise NV only, got 0x{result['fp_flags']:02X}"
-    assert result["exception"] is False, "unexpected exception"
+        result.fp_flags == 0x10
+    ), f"FMAX_D(sNaN, 1.0) should raise NV only, got 0x{result.fp_flags:02X}"
+    assert result.exception is False, "unexpected exception"
 
 
 @cocotb.test()
@@ -456,37 +375,37 @@ async def test_fmax_d_snan_after_clean_ops_sets_invalid(dut: Any) -> None:
     neg_two_d = 0xC000_0000_0000_0000
     snan_d = 0x7FF0_0000_0000_0001
 
-    for tag, op_name, src1, src2, expected in [
-        (9, "FMIN_D", two_d, one_d, one_d),
-        (10, "FMAX_D", two_d, one_d, two_d),
-        (11, "FMAX_D", neg_one_d, neg_two_d, neg_one_d),
+    for tag, op, src1, src2, expected in [
+        (9, OP_FMIN_D, two_d, one_d, one_d),
+        (10, OP_FMAX_D, two_d, one_d, two_d),
+        (11, OP_FMAX_D, neg_one_d, neg_two_d, neg_one_d),
     ]:
         iface.drive_issue(
             valid=True,
             rob_tag=tag,
-            op=_op(op_name),
+            op=op,
             src1_value=src1,
             src2_value=src2,
             rm=0,
         )
         await RisingEdge(iface.clock)
         iface.clear_issue()
-        result = await wait_for_complete(iface)
-        assert result["value"] == expected
-        assert result["fp_flags"] == 0
+        result = await wait_for_valid_result(iface)
+        assert result.value == expected
+        assert result.fp_flags == 0
         await RisingEdge(iface.clock)
 
     iface.drive_issue(
         valid=True,
         rob_tag=12,
-        op=_op("FMAX_D"),
+        op=OP_FMAX_D,
         src1_value=snan_d,
         src2_value=one_d,
         rm=0,
     )
     await RisingEdge(iface.clock)
     iface.clear_issue()
-    result = await wait_for_complete(iface)
+    result = await wait_for_valid_result(iface)
 
-    assert result["value"] == one_d
-    assert result["fp_flags"] == 0x10
+    assert result.value == one_d
+    assert result.fp_flags == 0x10
@@ -23,8 +23,28 @@ from typing import Any
 
 import cocotb
 from cocotb.clock import Clock
-from cocotb.triggers import FallingEdge, ReadOnly, RisingEdge
-
+from cocotb.triggers import ClockCycles, FallingEdge, First, ReadOnly, RisingEdge
+
+from .fp_add_shim_interface import (
+    FuComplete,
+    expect_no_fu_complete,
+    pack_rs_issue_fp2op,
+    wait_for_fu_complete,
+    with_rob_tag,
+)
+from .fp_constants import (
+    DP_2_0,
+    DP_6_0,
+    DP_9_0,
+    DP_16_0,
+    DP_25_0,
+    DP_MIN_SUBNORMAL,
+    DP_NEG_1_0,
+    SP_2_0,
+    SP_3_0,
+    SP_4_0,
+    SP_6_0,
+)
 from .fp_div_shim_interface import (
     FpDivShimInterface,
     CLOCK_PERIOD_NS,
@@ -34,26 +54,7 @@ from .fp_div_shim_interface import (
     OP_FSQRT_D,
 )
 
-# IEEE 754 single-precision constants (NaN-boxed in 64-bit)
-NAN_BOX = 0xFFFF_FFFF_0000_0000
-SP_2_0 = NAN_BOX | 0x4000_0000  # 2.0f
-SP_4_0 = NAN_BOX | 0x4080_0000  # 4.0f
-SP_6_0 = NAN_BOX | 0x40C0_0000  # 6.0f
-
-# IEEE 754 double-precision constants
-DP_2_0 = 0x4000_0000_0000_0000  # 2.0
-DP_6_0 = 0x4018_0000_0000_0000  # 6.0
-DP_9_0 = 0x4022_0000_0000_0000  # 9.0
-DP_16_0 = 0x4030_0000_0000_0000  # 16.0
-DP_25_0 = 0x4039_0000_0000_0000  # 25.0
-DP_NEG_1_0 = 0xBFF0_0000_0000_0000  # -1.0
-DP_MIN_SUBNORMAL = 0x0000_0000_0000_0001  # 2^-1074
-
-# Expected NaN-boxed results
-EXPECTED_3_0 = 0xFFFF_FFFF_4040_0000  # 6.0 / 2.0 = 3.0
-EXPECTED_2_0 = 0xFFFF_FFFF_4000_0000  # sqrt(4.0) = 2.0
-EXPECTED_3_0_SP = 0xFFFF_FFFF_4040_0000  # 6.0 / 2.0 = 3.0 (SP, NaN-boxed)
-EXPECTED_2_0_SP = 0xFFFF_FFFF_4000_0000  # sqrt(4.0) = 2.0 (SP, NaN-boxed)
+# Expected DP results (SP results use the NaN-boxed fp_constants values)
 EXPECTED_3_0_DP = 0x4008_0000_0000_0000  # 6.0 / 2.0 = 3.0 (DP)
 EXPECTED_4_0_DP = 0x4010_0000_0000_0000  # sqrt(16.0) = 4.0 (DP)
 EXPECTED_5_0_DP = 0x4014_0000_0000_0000  # sqrt(25.0) = 5.0 (DP)
@@ -62,38 +63,79 @@ EXPECTED_SQRT_MIN_SUBNORMAL_DP = 0x1E60_0000_0000_0000  # 2^-537
 
 FP_FLAG_NV = 0x10
 
+# Issue vectors reused across the burst tests (rob_tag 0; retag per op with
+# with_rob_tag), packed once at import.
+ISSUE_FDIV_S_6_2 = pack_rs_issue_fp2op(True, 0, OP_FDIV_S, SP_6_0, SP_2_0)
+ISSUE_FDIV_D_6_2 = pack_rs_issue_fp2op(True, 0, OP_FDIV_D, DP_6_0, DP_2_0)
+
 MAX_LATENCY = 80  # DP pipeline is 65 stages, allow margin
 SQRT_S_VISIBLE_CYCLES = 37
 SQRT_D_VISIBLE_CYCLES = 66
 
 
+# Built once per simulator run; see test_int_muldiv_shim.py for why the
+# clock is still started (and the DUT reset) per test.
+_iface: FpDivShimInterface | None = None
+
+
 async def setup(dut: Any) -> FpDivShimInterface:
-    """Start clock, reset DUT, and return interface."""
-    cocotb.start_soon(Clock(dut.i_clk, CLOCK_PERIOD_NS, unit="ns").start())
-    iface = FpDivShimInterface(dut)
-    await iface.reset()
-    return iface
+    """Start clock, reset DUT, and return the shared interface."""
+    global _iface
+    cocotb.start_soon(Clock(dut.i_clk, CLOCK_PERIOD_NS, unit="ns", impl="gpi").start())
+    if _iface is None or _iface.dut is not dut:
+        _iface = FpDivShimInterface(dut)
+    await _iface.reset()
+    return _iface
 
 
-async def wait_for_completion(
+async def wait_for_valid_result(
     iface: FpDivShimInterface, max_cycles: int = MAX_LATENCY
-) -> dict:
+) -> FuComplete:
     """Poll o_fu_complete.valid, drive i_div_accepted to pop, return result.
 
     Raises AssertionError if the operation does not complete in time.
     """
-    for _ in range(max_cycles):
-        await RisingEdge(iface.clock)
-        result = iface.read_fu_complete()
-        if result["valid"]:
-            # Drive accepted for one cycle to pop the FIFO entry
-            iface.drive_div_accepted()
-            await RisingEdge(iface.clock)
-            iface.clear_div_accepted()
-            return result
-    raise AssertionError(
-        f"FU did not produce a valid result within {max_cycles} cycles"
+    result = await wait_for_fu_complete(
+        iface.clock, iface.fu_complete_handle, max_cycles, CLOCK_PERIOD_NS
     )
+    if not result.valid:
+        raise AssertionError(
+            f"FU did not produce a valid result within {max_cycles} cycles"
+        )
+    # Drive accepted for one cycle to pop the FIFO entry
+    await FallingEdge(iface.clock)
+    await iface.pulse_div_accepted()
+    return result
+
+
+async def collect_result_list(
+    iface: FpDivShimInterface, count: int, max_cycles: int = MAX_LATENCY + 10
+) -> list[FuComplete]:
+    """Pop up to *count* results within *max_cycles*; return them in order.
+
+    A collector task accepts each result as it arrives while the caller
+    waits on its completion or the cycle budget, whichever comes first.
+    On a timeout the partial list is returned so the caller can report
+    which results went missing.
+    """
+    collected: list[FuComplete] = []
+
+    async def _collect() -> None:
+        for _ in range(count):
+            collected.append(await wait_for_valid_result(iface, max_cycles))
+
+    collector = cocotb.start_soon(_collect())
+    await First(collector.complete, ClockCycles(iface.clock, max_cycles))
+    collector.cancel()
+    return collected
+
+
+async def collect_results(
+    iface: FpDivShimInterface, count: int, max_cycles: int = MAX_LATENCY + 10
+) -> dict[int, int]:
+    """As collect_result_list(), keyed {tag: value} in completion order."""
+    results = await collect_result_list(iface, count, max_cycles)
+    return {result.tag: result.value for result in results}
 
 
 async def expect_completion_at_cycle(
@@ -104,34 +146,31 @@ async def expect_completion_at_cycle(
     expected_flags: int = 0,
 ) -> None:
     """Require the first shim-visible completion on one exact post-issue cycle."""
-    result = {}
-    for cycle in range(1, expected_cycle + 1):
+    for cycle in range(1, expected_cycle):
         await RisingEdge(iface.clock)
         await ReadOnly()
-        result = iface.read_fu_complete()
-        if cycle < expected_cycle:
-            assert not result["valid"], (
-                f"Completion appeared at cycle {cycle}, expected cycle "
-                f"{expected_cycle}"
-            )
-
-    assert result["valid"], f"No completion at expected cycle {expected_cycle}"
+        assert not iface.valid_asserted(), (
+            f"Completion appeared at cycle {cycle}, expected cycle " f"{expected_cycle}"
+        )
+
+    await RisingEdge(iface.clock)
+    await ReadOnly()
+    result = iface.read_fu_complete()
+    assert result.valid, f"No completion at expected cycle {expected_cycle}"
     assert (
-        result["tag"] == expected_tag
-    ), f"Tag mismatch: expected {expected_tag}, got {result['tag']}"
-    assert result["value"] == expected_value, (
+        result.tag == expected_tag
+    ), f"Tag mismatch: expected {expected_tag}, got {result.tag}"
+    assert result.value == expected_value, (
         f"Value mismatch: expected 0x{expected_value:016X}, "
-        f"got 0x{result['value']:016X}"
+        f"got 0x{result.value:016X}"
     )
-    assert result["fp_flags"] == expected_flags, (
+    assert result.fp_flags == expected_flags, (
         f"Flags mismatch: expected 0x{expected_flags:02X}, "
-        f"got 0x{result['fp_flags']:02X}"
+        f"got 0x{result.fp_flags:02X}"
     )
 
     await FallingEdge(iface.clock)
-    iface.drive_div_accepted()
-    await RisingEdge(iface.clock)
-    iface.clear_div_accepted()
+    await iface.pulse_div_accepted()
 
 
 # ============================================================================
@@ -143,69 +182,44 @@ async def test_reset_state(dut: Any) -> None:
     iface = await setup(dut)
 
     result = iface.read_fu_complete()
-    assert not result["valid"], "valid should be 0 after reset"
+    assert not result.valid, "valid should be 0 after reset"
     assert not iface.read_busy(), "busy should be 0 after reset"
 
 
 # ============================================================================
-# Test 2: FDIV_S basic — 6.0 / 2.0 = 3.0
+# Tests 2-3: FDIV_S 6.0 / 2.0 = 3.0 and FSQRT_S sqrt(4.0) = 2.0
 # ============================================================================
-@cocotb.test()
-async def test_fdiv_s_basic(dut: Any) -> None:
-    """FDIV_S: 6.0 / 2.0 = 3.0 (NaN-boxed single-precision result)."""
-    iface = await setup(dut)
-
-    rob_tag = 1
-    iface.drive_issue(
-        valid=True,
-        rob_tag=rob_tag,
-        op=OP_FDIV_S,
-        src1_value=SP_6_0,
-        src2_value=SP_2_0,
-    )
-
-    # Deassert issue after one cycle so the shim only fires once
-    await RisingEdge(iface.clock)
-    iface.clear_issue()
-
-    result = await wait_for_completion(iface)
-    assert result["valid"], "Expected valid completion"
-    assert (
-        result["tag"] == rob_tag
-    ), f"Tag mismatch: expected {rob_tag}, got {result['tag']}"
-    assert (
-        result["value"] == EXPECTED_3_0
-    ), f"Value mismatch: expected 0x{EXPECTED_3_0:016X}, got 0x{result['value']:016X}"
+# op name -> (op, rob_tag, src1_value, src2_value, expected NaN-boxed result)
+_BASIC_CASES = {
+    "FDIV_S": (OP_FDIV_S, 1, SP_6_0, SP_2_0, SP_3_0),
+    "FSQRT_S": (OP_FSQRT_S, 5, SP_4_0, 0, SP_2_0),
+}
 
 
-# ============================================================================
-# Test 3: FSQRT_S basic — sqrt(4.0) = 2.0
-# ============================================================================
 @cocotb.test()
-async def test_fsqrt_s_basic(dut: Any) -> None:
-    """FSQRT_S: sqrt(4.0) = 2.0 (NaN-boxed single-precision result)."""
+@cocotb.parametrize(op_name=list(_BASIC_CASES))
+async def test_basic_result(dut: Any, op_name: str) -> None:
+    """Single FDIV_S / FSQRT_S produces the NaN-boxed single-precision result."""
+    op, rob_tag, src1_value, src2_value, expected = _BASIC_CASES[op_name]
     iface = await setup(dut)
 
-    rob_tag = 5
     iface.drive_issue(
         valid=True,
         rob_tag=rob_tag,
-        op=OP_FSQRT_S,
-        src1_value=SP_4_0,
-        src2_value=0,
+        op=op,
+        src1_value=src1_value,
+        src2_value=src2_value,
     )
 
+    # Deassert issue after one cycle so the shim only fires once
     await RisingEdge(iface.clock)
     iface.clear_issue()
 
-    result = await wait_for_completion(iface)
-    assert result["valid"], "Expected valid completion"
+    result = await wait_for_valid_result(iface)
+    assert result.tag == rob_tag, f"Tag mismatch: expected {rob_tag}, got {result.tag}"
     assert (
-        result["tag"] == rob_tag
-    ), f"Tag mismatch: expected {rob_tag}, got {result['tag']}"
-    assert (
-        result["value"] == EXPECTED_2_0
-    ), f"Value mismatch: expected 0x{EXPECTED_2_0:016X}, got 0x{result['value']:016X}"
+        result.value == expected
+    ), f"Value mismatch: expected 0x{expected:016X}, got 0x{result.value:016X}"
 
 
 # ============================================================================
@@ -216,13 +230,7 @@ async def test_busy_during_operation(dut: Any) -> None:
     """Fire FDIV_S, verify busy=0 (pipelined) while single op in-flight."""
     iface = await setup(dut)
 
-    iface.drive_issue(
-        valid=True,
-        rob_tag=2,
-        op=OP_FDIV_S,
-        src1_value=SP_6_0,
-        src2_value=SP_2_0,
-    )
+    iface.drive_issue_packed(with_rob_tag(ISSUE_FDIV_S_6_2, 2))
 
     await RisingEdge(iface.clock)
     iface.clear_issue()
@@ -232,8 +240,7 @@ async def test_busy_during_operation(dut: Any) -> None:
     assert not iface.read_busy(), "Expected busy=0 with single in-flight op (pipelined)"
 
     # Wait for completion and accept
-    result = await wait_for_completion(iface)
-    assert result["valid"], "Expected valid completion"
+    await wait_for_valid_result(iface)
 
 
 # ============================================================================
@@ -244,20 +251,13 @@ async def test_flush_clears_inflight(dut: Any) -> None:
     """Fire FDIV_S, assert i_flush after a few cycles, verify no valid output."""
     iface = await setup(dut)
 
-    iface.drive_issue(
-        valid=True,
-        rob_tag=3,
-        op=OP_FDIV_S,
-        src1_value=SP_6_0,
-        src2_value=SP_2_0,
-    )
+    iface.drive_issue_packed(with_rob_tag(ISSUE_FDIV_S_6_2, 3))
 
     await RisingEdge(iface.clock)
     iface.clear_issue()
 
     # Let the operation run for a few cycles
-    for _ in range(3):
-        await RisingEdge(iface.clock)
+    await ClockCycles(iface.clock, 3)
 
     # Assert full flush
     iface.drive_flush()
@@ -265,12 +265,7 @@ async def test_flush_clears_inflight(dut: Any) -> None:
     iface.clear_flush()
 
     # Wait for the remaining latency; the result should be suppressed
-    for _ in range(MAX_LATENCY):
-        await RisingEdge(iface.clock)
-        result = iface.read_fu_complete()
-        assert not result[
-            "valid"
-        ], "Expected no valid output after flush, but got valid=1"
+    await expect_no_fu_complete(iface.fu_complete_handle, MAX_LATENCY * CLOCK_PERIOD_NS)
 
 
 # ============================================================================
@@ -283,32 +278,15 @@ async def test_fdiv_s_back_to_back(dut: Any) -> None:
 
     tags = [10, 11, 12, 13]
     # Issue 4 consecutive FDIV_S ops
-    for tag in tags:
-        iface.drive_issue(
-            valid=True,
-            rob_tag=tag,
-            op=OP_FDIV_S,
-            src1_value=SP_6_0,
-            src2_value=SP_2_0,
-        )
-        await RisingEdge(iface.clock)
-    iface.clear_issue()
+    await iface.issue_burst_packed(with_rob_tag(ISSUE_FDIV_S_6_2, tag) for tag in tags)
 
-    # Collect all 4 results
-    collected_tags = []
-    for _ in range(MAX_LATENCY + 10):
-        await RisingEdge(iface.clock)
-        result = iface.read_fu_complete()
-        if result["valid"]:
-            collected_tags.append(result["tag"])
-            assert (
-                result["value"] == EXPECTED_3_0
-            ), f"Value mismatch: expected 0x{EXPECTED_3_0:016X}, got 0x{result['value']:016X}"
-            iface.drive_div_accepted()
-            await RisingEdge(iface.clock)
-            iface.clear_div_accepted()
-        if len(collected_tags) == len(tags):
-            break
+    # Collect all 4 results, waking only when o_fu_complete changes
+    collected = await collect_results(iface, len(tags))
+    collected_tags = list(collected)
+    for value in collected.values():
+        assert (
+            value == SP_3_0
+        ), f"Value mismatch: expected 0x{SP_3_0:016X}, got 0x{value:016X}"
 
     assert collected_tags == tags, f"Expected tags {tags}, got {collected_tags}"
 
@@ -322,26 +300,13 @@ async def test_interleaved_div_sqrt(dut: Any) -> None:
     iface = await setup(dut)
 
     ops = [
-        (20, OP_FDIV_S, SP_6_0, SP_2_0, EXPECTED_3_0_SP),
-        (21, OP_FSQRT_S, SP_4_0, 0, EXPECTED_2_0_SP),
+        (20, OP_FDIV_S, SP_6_0, SP_2_0, SP_3_0),
+        (21, OP_FSQRT_S, SP_4_0, 0, SP_2_0),
     ]
 
-    for tag, op, s1, s2, _exp in ops:
-        iface.drive_issue(valid=True, rob_tag=tag, op=op, src1_value=s1, src2_value=s2)
-        await RisingEdge(iface.clock)
-    iface.clear_issue()
+    await iface.issue_burst((tag, op, s1, s2) for tag, op, s1, s2, _exp in ops)
 
-    collected = {}
-    for _ in range(MAX_LATENCY + 10):
-        await RisingEdge(iface.clock)
-        result = iface.read_fu_complete()
-        if result["valid"]:
-            collected[result["tag"]] = result["value"]
-            iface.drive_div_accepted()
-            await RisingEdge(iface.clock)
-            iface.clear_div_accepted()
-        if len(collected) == len(ops):
-            break
+    collected = await collect_results(iface, len(ops))
 
     for tag, _op, _s1, _s2, expected in ops:
         assert tag in collected, f"Tag {tag} not found in results"
@@ -358,29 +323,18 @@ async def test_flush_multiple_inflight(dut: Any) -> None:
     """Issue 3 ops, flush, verify all suppressed."""
     iface = await setup(dut)
 
-    for tag in [30, 31, 32]:
-        iface.drive_issue(
-            valid=True,
-            rob_tag=tag,
-            op=OP_FDIV_S,
-            src1_value=SP_6_0,
-            src2_value=SP_2_0,
-        )
-        await RisingEdge(iface.clock)
-    iface.clear_issue()
+    await iface.issue_burst_packed(
+        with_rob_tag(ISSUE_FDIV_S_6_2, tag) for tag in [30, 31, 32]
+    )
 
     # Flush after 5 cycles
-    for _ in range(5):
-        await RisingEdge(iface.clock)
+    await ClockCycles(iface.clock, 5)
     iface.drive_flush()
     await RisingEdge(iface.clock)
     iface.clear_flush()
 
     # Verify no valid output
-    for _ in range(MAX_LATENCY):
-        await RisingEdge(iface.clock)
-        result = iface.read_fu_complete()
-        assert not result["valid"], "Expected no valid output after flush"
+    await expect_no_fu_complete(iface.fu_complete_handle, MAX_LATENCY * CLOCK_PERIOD_NS)
 
 
 # ============================================================================
@@ -392,35 +346,17 @@ async def test_fifo_backpressure(dut: Any) -> None:
     iface = await setup(dut)
 
     # Issue 4 ops (saturates credits)
-    for tag in [40, 41, 42, 43]:
-        iface.drive_issue(
-            valid=True,
-            rob_tag=tag,
-            op=OP_FDIV_S,
-            src1_value=SP_6_0,
-            src2_value=SP_2_0,
-        )
-        await RisingEdge(iface.clock)
-    iface.clear_issue()
+    await iface.issue_burst_packed(
+        with_rob_tag(ISSUE_FDIV_S_6_2, tag) for tag in [40, 41, 42, 43]
+    )
 
     # After 4 in-flight, busy should be asserted
     await RisingEdge(iface.clock)
     assert iface.read_busy(), "Expected busy=1 with 4 in-flight ops"
 
     # Accept results as they come
-    accepted = 0
-    for _ in range(MAX_LATENCY + 10):
-        await RisingEdge(iface.clock)
-        result = iface.read_fu_complete()
-        if result["valid"]:
-            iface.drive_div_accepted()
-            await RisingEdge(iface.clock)
-            iface.clear_div_accepted()
-            accepted += 1
-        if accepted == 4:
-            break
-
-    assert accepted == 4, f"Expected 4 results, got {accepted}"
+    collected = await collect_results(iface, 4)
+    assert len(collected) == 4, f"Expected 4 results, got {len(collected)}"
 
     # After all drained, busy should be 0
     await RisingEdge(iface.clock)
@@ -441,43 +377,20 @@ async def test_cross_precision_collision(dut: Any) -> None:
     iface = await setup(dut)
 
     # Issue FDIV_D (65-cycle pipeline)
-    iface.drive_issue(
-        valid=True,
-        rob_tag=14,
-        op=OP_FDIV_D,
-        src1_value=DP_6_0,
-        src2_value=DP_2_0,
-    )
+    iface.drive_issue_packed(with_rob_tag(ISSUE_FDIV_D_6_2, 14))
     await RisingEdge(iface.clock)
     iface.clear_issue()
 
     # Wait 28 cycles so next issue is 29 cycles after the DP issue
-    for _ in range(28):
-        await RisingEdge(iface.clock)
+    await ClockCycles(iface.clock, 28)
 
     # Issue FDIV_S (36-cycle pipeline, completes same cycle as FDIV_D)
-    iface.drive_issue(
-        valid=True,
-        rob_tag=15,
-        op=OP_FDIV_S,
-        src1_value=SP_6_0,
-        src2_value=SP_2_0,
-    )
+    iface.drive_issue_packed(with_rob_tag(ISSUE_FDIV_S_6_2, 15))
     await RisingEdge(iface.clock)
     iface.clear_issue()
 
     # Collect both results
-    collected = {}
-    for _ in range(MAX_LATENCY + 10):
-        await RisingEdge(iface.clock)
-        result = iface.read_fu_complete()
-        if result["valid"]:
-            collected[result["tag"]] = result["value"]
-            iface.drive_div_accepted()
-            await RisingEdge(iface.clock)
-            iface.clear_div_accepted()
-        if len(collected) == 2:
-            break
+    collected = await collect_results(iface, 2)
 
     assert 14 in collected, "FDIV_D result (tag 14) not found"
     assert 15 in collected, "FDIV_S result (tag 15) not found"
@@ -485,8 +398,8 @@ async def test_cross_precision_collision(dut: Any) -> None:
         collected[14] == EXPECTED_3_0_DP
     ), f"FDIV_D value mismatch: expected 0x{EXPECTED_3_0_DP:016X}, got 0x{collected[14]:016X}"
     assert (
-        collected[15] == EXPECTED_3_0_SP
-    ), f"FDIV_S value mismatch: expected 0x{EXPECTED_3_0_SP:016X}, got 0x{collected[15]:016X}"
+        collected[15] == SP_3_0
+    ), f"FDIV_S value mismatch: expected 0x{SP_3_0:016X}, got 0x{collected[15]:016X}"
 
 
 # ============================================================================
@@ -504,60 +417,27 @@ async def test_hold_overwrite_stress(dut: Any) -> None:
     """
     iface = await setup(dut)
 
-    # Issue FDIV_D#1
-    iface.drive_issue(
-        valid=True,
-        rob_tag=16,
-        op=OP_FDIV_D,
-        src1_value=DP_6_0,
-        src2_value=DP_2_0,
+    # Issue FDIV_D#1, then FDIV_D#2 one cycle later
+    await iface.issue_burst_packed(
+        with_rob_tag(ISSUE_FDIV_D_6_2, tag) for tag in [16, 17]
     )
-    await RisingEdge(iface.clock)
-
-    # Issue FDIV_D#2 (1 cycle later)
-    iface.drive_issue(
-        valid=True,
-        rob_tag=17,
-        op=OP_FDIV_D,
-        src1_value=DP_6_0,
-        src2_value=DP_2_0,
-    )
-    await RisingEdge(iface.clock)
-    iface.clear_issue()
 
     # Wait until 29 cycles after FDIV_D#1 issue, then issue FDIV_S
-    for _ in range(27):
-        await RisingEdge(iface.clock)
+    await ClockCycles(iface.clock, 27)
 
-    iface.drive_issue(
-        valid=True,
-        rob_tag=18,
-        op=OP_FDIV_S,
-        src1_value=SP_6_0,
-        src2_value=SP_2_0,
-    )
+    iface.drive_issue_packed(with_rob_tag(ISSUE_FDIV_S_6_2, 18))
     await RisingEdge(iface.clock)
     iface.clear_issue()
 
     # Collect all 3 results
-    collected = {}
-    for _ in range(MAX_LATENCY + 20):
-        await RisingEdge(iface.clock)
-        result = iface.read_fu_complete()
-        if result["valid"]:
-            collected[result["tag"]] = result["value"]
-            iface.drive_div_accepted()
-            await RisingEdge(iface.clock)
-            iface.clear_div_accepted()
-        if len(collected) == 3:
-            break
+    collected = await collect_results(iface, 3, MAX_LATENCY + 20)
 
     assert 16 in collected, "FDIV_D#1 (tag 16) lost — possible hold overwrite"
     assert 17 in collected, "FDIV_D#2 (tag 17) lost — possible hold overwrite"
     assert 18 in collected, "FDIV_S (tag 18) lost"
     assert collected[16] == EXPECTED_3_0_DP
     assert collected[17] == EXPECTED_3_0_DP
-    assert collected[18] == EXPECTED_3_0_SP
+    assert collected[18] == SP_3_0
 
 
 # ============================================================================
@@ -573,36 +453,20 @@ async def test_partial_flush_fifo_entry(dut: Any) -> None:
     iface = await setup(dut)
 
     # Issue two FDIV_S back-to-back
-    iface.drive_issue(
-        valid=True,
-        rob_tag=2,
-        op=OP_FDIV_S,
-        src1_value=SP_6_0,
-        src2_value=SP_2_0,
+    await iface.issue_burst_packed(
+        with_rob_tag(ISSUE_FDIV_S_6_2, tag) for tag in [2, 4]
     )
-    await RisingEdge(iface.clock)
-    iface.drive_issue(
-        valid=True,
-        rob_tag=4,
-        op=OP_FDIV_S,
-        src1_value=SP_6_0,
-        src2_value=SP_2_0,
-    )
-    await RisingEdge(iface.clock)
-    iface.clear_issue()
 
     # Wait for first result to appear in FIFO, then wait a few more cycles
     # so the second op also completes (1 cycle later) and the arbiter pushes
     # it into the FIFO.  Don't accept anything — both must sit in FIFO.
-    for _ in range(MAX_LATENCY + 10):
-        await RisingEdge(iface.clock)
-        result = iface.read_fu_complete()
-        if result["valid"]:
-            break
+    result = await wait_for_fu_complete(
+        iface.clock, iface.fu_complete_handle, MAX_LATENCY + 10, CLOCK_PERIOD_NS
+    )
+    assert result.valid, "First FDIV_S never reached the FIFO"
     # The second FDIV_S completes 1 cycle after the first.  Give 3 extra
     # cycles for it to transit hold → arbiter → FIFO.
-    for _ in range(3):
-        await RisingEdge(iface.clock)
+    await ClockCycles(iface.clock, 3)
 
     # Partial flush: flush everything younger than tag 3, head=0
     # tag 2: age=2, flush_age=3 → NOT younger → survives
@@ -613,19 +477,12 @@ async def test_partial_flush_fifo_entry(dut: Any) -> None:
 
     # Accept first result (tag 2) — should be valid
     result = iface.read_fu_complete()
-    assert result["valid"], "Expected tag 2 result to survive partial flush"
-    assert result["tag"] == 2, f"Expected tag 2, got {result['tag']}"
-    iface.drive_div_accepted()
-    await RisingEdge(iface.clock)
-    iface.clear_div_accepted()
+    assert result.valid, "Expected tag 2 result to survive partial flush"
+    assert result.tag == 2, f"Expected tag 2, got {result.tag}"
+    await iface.pulse_div_accepted()
 
     # After accepting tag 2, tag 4 should NOT appear (flushed/auto-drained)
-    for _ in range(5):
-        await RisingEdge(iface.clock)
-        result = iface.read_fu_complete()
-        assert not result[
-            "valid"
-        ], f"Expected tag 4 to be suppressed, but got valid tag {result['tag']}"
+    await expect_no_fu_complete(iface.fu_complete_handle, 5 * CLOCK_PERIOD_NS)
 
 
 # ============================================================================
@@ -649,7 +506,7 @@ async def test_fsqrt_exact_latency(dut: Any) -> None:
         iface,
         expected_cycle=SQRT_S_VISIBLE_CYCLES,
         expected_tag=24,
-        expected_value=EXPECTED_2_0_SP,
+        expected_value=SP_2_0,
     )
 
     iface.drive_issue(
@@ -684,28 +541,12 @@ async def test_fsqrt_d_back_to_back_distinct(dut: Any) -> None:
         (27, DP_25_0, EXPECTED_5_0_DP, 0),
     ]
 
-    for tag, operand, _expected, _flags in operations:
-        iface.drive_issue(
-            valid=True,
-            rob_tag=tag,
-            op=OP_FSQRT_D,
-            src1_value=operand,
-            src2_value=0,
-        )
-        await RisingEdge(iface.clock)
-    iface.clear_issue()
+    await iface.issue_burst(
+        (tag, OP_FSQRT_D, operand, 0) for tag, operand, _expected, _flags in operations
+    )
 
-    collected = []
-    for _ in range(MAX_LATENCY + 20):
-        await RisingEdge(iface.clock)
-        result = iface.read_fu_complete()
-        if result["valid"]:
-            collected.append((result["tag"], result["value"], result["fp_flags"]))
-            iface.drive_div_accepted()
-            await RisingEdge(iface.clock)
-            iface.clear_div_accepted()
-        if len(collected) == len(operations):
-            break
+    results = await collect_result_list(iface, len(operations), MAX_LATENCY + 20)
+    collected = [(result.tag, result.value, result.fp_flags) for result in results]
 
     expected = [(tag, value, flags) for tag, _operand, value, flags in operations]
     assert collected == expected, f"Expected {expected}, got {collected}"
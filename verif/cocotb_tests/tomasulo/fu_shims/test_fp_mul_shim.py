@@ -23,9 +23,14 @@ from typing import Any
 
 import cocotb
 from cocotb.clock import Clock
-from cocotb.triggers import FallingEdge, RisingEdge
-
-from .fp_add_shim_interface import _parse_instr_op_enum
+from cocotb.triggers import FallingEdge, ReadOnly, RisingEdge
+
+from .fp_add_shim_interface import (
+    FuComplete,
+    _parse_instr_op_enum,
+    wait_for_fu_complete,
+)
+from .fp_constants import SP_1_0, SP_2_0, SP_3_0, SP_5_0, SP_6_0, SP_7_0
 from .fp_mul_shim_interface import FpMulShimInterface
 
 CLOCK_PERIOD_NS = 10
@@ -39,28 +44,6 @@ OP_FMUL_S = _INSTR_OPS["FMUL_S"]
 OP_FMADD_S = _INSTR_OPS["FMADD_S"]
 OP_FMSUB_S = _INSTR_OPS["FMSUB_S"]
 
-# ---------------------------------------------------------------------------
-# IEEE 754 single-precision constants (NaN-boxed in 64-bit)
-# ---------------------------------------------------------------------------
-NAN_BOX = 0xFFFF_FFFF_0000_0000
-
-F32_1_0 = 0x3F80_0000
-F32_2_0 = 0x4000_0000
-F32_3_0 = 0x4040_0000
-F32_5_0 = 0x40A0_0000
-F32_6_0 = 0x40C0_0000
-F32_7_0 = 0x40E0_0000
-
-# NaN-boxed 64-bit representations for driving src values
-SRC_1_0 = NAN_BOX | F32_1_0
-SRC_2_0 = NAN_BOX | F32_2_0
-SRC_3_0 = NAN_BOX | F32_3_0
-
-# Expected NaN-boxed 64-bit results
-RES_5_0 = NAN_BOX | F32_5_0
-RES_6_0 = NAN_BOX | F32_6_0
-RES_7_0 = NAN_BOX | F32_7_0
-
 # Maximum cycles to wait for completion (mult ~9 cycles, fma ~10 cycles)
 MAX_LATENCY = 20
 
@@ -68,39 +51,44 @@ MAX_LATENCY = 20
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
+# Built once per simulator run; see test_int_muldiv_shim.py for why the
+# clock is still started (and the DUT reset) per test.
+_iface: FpMulShimInterface | None = None
+
+
 async def setup(dut: Any) -> FpMulShimInterface:
-    """Start clock, reset DUT, and return the interface."""
-    cocotb.start_soon(Clock(dut.i_clk, CLOCK_PERIOD_NS, unit="ns").start())
-    iface = FpMulShimInterface(dut)
-    await iface.reset()
-    return iface
+    """Start clock, reset DUT, and return the shared interface."""
+    global _iface
+    cocotb.start_soon(Clock(dut.i_clk, CLOCK_PERIOD_NS, unit="ns", impl="gpi").start())
+    if _iface is None or _iface.dut is not dut:
+        _iface = FpMulShimInterface(dut)
+    await _iface.reset()
+    return _iface
 
 
-async def wait_for_complete(dut: Any, iface: FpMulShimInterface) -> dict:
+async def wait_for_valid_result(dut: Any, iface: FpMulShimInterface) -> FuComplete:
     """Wait until o_fu_complete.valid is asserted and return the unpacked result.
 
     Raises an assertion error if valid is not seen within MAX_LATENCY cycles.
     """
-    for _ in range(MAX_LATENCY):
-        await RisingEdge(dut.i_clk)
-        await FallingEdge(dut.i_clk)
-        result = iface.read_fu_complete()
-        if result["valid"]:
-            return result
-    raise AssertionError("fu_complete.valid not asserted within MAX_LATENCY cycles")
+    result = await wait_for_fu_complete(
+        dut.i_clk, iface.fu_complete_handle, MAX_LATENCY, CLOCK_PERIOD_NS
+    )
+    if not result.valid:
+        raise AssertionError("fu_complete.valid not asserted within MAX_LATENCY cycles")
+    return result
 
 
 async def wait_for_completions(
     dut: Any, iface: FpMulShimInterface, count: int
-) -> list[dict]:
+) -> list[FuComplete]:
     """Collect *count* completions within a bounded number of cycles."""
-    results: list[dict] = []
+    results: list[FuComplete] = []
     for _ in range(MAX_LATENCY + count + 8):
         await RisingEdge(dut.i_clk)
-        await FallingEdge(dut.i_clk)
-        result = iface.read_fu_complete()
-        if result["valid"]:
-            results.append(result)
+        await ReadOnly()
+        if iface.valid_asserted():
+            results.append(iface.read_fu_complete())
             if len(results) == count:
                 return results
     raise AssertionError(f"only saw {len(results)} of {count} expected completions")
@@ -115,97 +103,46 @@ async def test_reset_state(dut: Any) -> None:
     iface = await setup(dut)
 
     result = iface.read_fu_complete()
-    assert result["valid"] == 0, f"Expected valid=0 after reset, got {result['valid']}"
+    assert result.valid == 0, f"Expected valid=0 after reset, got {result.valid}"
     assert not iface.read_busy(), "Expected busy=0 after reset"
 
 
 # ============================================================================
-# Test 2: FMUL_S basic -- 2.0 * 3.0 = 6.0 (NaN-boxed)
+# Tests 2-4: FMUL_S / FMADD_S / FMSUB_S basic (NaN-boxed results)
 # ============================================================================
-@cocotb.test()
-async def test_fmul_s_basic(dut: Any) -> None:
-    """FMUL_S: 2.0f * 3.0f = 6.0f, result is NaN-boxed."""
-    iface = await setup(dut)
+# op name -> (op, rob_tag, src3_value, expected); src1 = 2.0f and src2 = 3.0f.
+_ARITH_CASES = {
+    "FMUL_S": (OP_FMUL_S, 1, 0, SP_6_0),  # 2.0 * 3.0 = 6.0
+    "FMADD_S": (OP_FMADD_S, 2, SP_1_0, SP_7_0),  # 2.0 * 3.0 + 1.0 = 7.0
+    "FMSUB_S": (OP_FMSUB_S, 3, SP_1_0, SP_5_0),  # 2.0 * 3.0 - 1.0 = 5.0
+}
 
-    iface.drive_issue(
-        valid=True,
-        rob_tag=1,
-        op=OP_FMUL_S,
-        src1_value=SRC_2_0,
-        src2_value=SRC_3_0,
-    )
-    await RisingEdge(dut.i_clk)
-    await FallingEdge(dut.i_clk)
-
-    # Clear issue after one cycle
-    iface.drive_issue(valid=False, rob_tag=0, op=0, src1_value=0, src2_value=0)
-
-    result = await wait_for_complete(dut, iface)
-
-    assert result["valid"], "Expected valid completion"
-    assert result["tag"] == 1, f"Expected tag=1, got {result['tag']}"
-    assert result["value"] == RES_6_0, (
-        f"Expected NaN-boxed 6.0f (0x{RES_6_0:016X}), " f"got 0x{result['value']:016X}"
-    )
 
-
-# ============================================================================
-# Test 3: FMADD_S basic -- 2.0 * 3.0 + 1.0 = 7.0
-# ============================================================================
 @cocotb.test()
-async def test_fmadd_s_basic(dut: Any) -> None:
-    """FMADD_S: src1=2.0f, src2=3.0f, src3=1.0f -> 2.0*3.0+1.0 = 7.0f."""
+@cocotb.parametrize(op_name=list(_ARITH_CASES))
+async def test_arith_basic(dut: Any, op_name: str) -> None:
+    """src1=2.0f, src2=3.0f (src3=1.0f for FMA) -> NaN-boxed single result."""
+    op, rob_tag, src3_value, expected = _ARITH_CASES[op_name]
     iface = await setup(dut)
 
     iface.drive_issue(
         valid=True,
-        rob_tag=2,
-        op=OP_FMADD_S,
-        src1_value=SRC_2_0,
-        src2_value=SRC_3_0,
-        src3_value=SRC_1_0,
+        rob_tag=rob_tag,
+        op=op,
+        src1_value=SP_2_0,
+        src2_value=SP_3_0,
+        src3_value=src3_value,
     )
     await RisingEdge(dut.i_clk)
-    await FallingEdge(dut.i_clk)
-
-    iface.drive_issue(valid=False, rob_tag=0, op=0, src1_value=0, src2_value=0)
-
-    result = await wait_for_complete(dut, iface)
-
-    assert result["valid"], "Expected valid completion"
-    assert result["tag"] == 2, f"Expected tag=2, got {result['tag']}"
-    assert result["value"] == RES_7_0, (
-        f"Expected NaN-boxed 7.0f (0x{RES_7_0:016X}), " f"got 0x{result['value']:016X}"
-    )
-
-
-# ============================================================================
-# Test 4: FMSUB_S basic -- 2.0 * 3.0 - 1.0 = 5.0
-# ============================================================================
-@cocotb.test()
-async def test_fmsub_s_basic(dut: Any) -> None:
-    """FMSUB_S: src1=2.0f, src2=3.0f, src3=1.0f -> 2.0*3.0-1.0 = 5.0f."""
-    iface = await setup(dut)
-
-    iface.drive_issue(
-        valid=True,
-        rob_tag=3,
-        op=OP_FMSUB_S,
-        src1_value=SRC_2_0,
-        src2_value=SRC_3_0,
-        src3_value=SRC_1_0,
-    )
-    await RisingEdge(dut.i_clk)
-    await FallingEdge(dut.i_clk)
-
-    iface.drive_issue(valid=False, rob_tag=0, op=0, src1_value=0, src2_value=0)
 
-    result = await wait_for_complete(dut, iface)
+    # Clear issue after one cycle
+    iface.clear_issue()
 
-    assert result["valid"], "Expected valid completion"
-    assert result["tag"] == 3, f"Expected tag=3, got {result['tag']}"
-    assert result["value"] == RES_5_0, (
-        f"Expected NaN-boxed 5.0f (0x{RES_5_0:016X}), " f"got 0x{result['value']:016X}"
+    result = await wait_for_valid_result(dut, iface)
+    assert result.tag == rob_tag, f"Expected tag={rob_tag}, got {result.tag}"
+    assert result.value == expected, (
+        f"{op_name}: expected NaN-boxed 0x{expected:016X}, "
+        f"got 0x{result.value:016X}"
     )
 
 
@@ -223,22 +160,20 @@ async def test_single_operation_does_not_assert_busy(dut: Any) -> None:
         valid=True,
         rob_tag=4,
         op=OP_FMUL_S,
-        src1_value=SRC_2_0,
-        src2_value=SRC_3_0,
+        src1_value=SP_2_0,
+        src2_value=SP_3_0,
     )
-    await RisingEdge(dut.i_clk)
     await FallingEdge(dut.i_clk)
 
     # Clear issue after one cycle
-    iface.drive_issue(valid=False, rob_tag=0, op=0, src1_value=0, src2_value=0)
+    iface.clear_issue()
 
     assert (
         not iface.read_busy()
     ), "busy should remain 0 while pipeline credits are available"
 
     # Wait for completion
-    result = await wait_for_complete(dut, iface)
-    assert result["valid"], "Expected valid completion"
+    await wait_for_valid_result(dut, iface)
 
     # After completion, busy should still be low.
     await RisingEdge(dut.i_clk)
@@ -258,30 +193,26 @@ async def test_flush_clears_inflight(dut: Any) -> None:
         valid=True,
         rob_tag=5,
         op=OP_FMUL_S,
-        src1_value=SRC_2_0,
-        src2_value=SRC_3_0,
+        src1_value=SP_2_0,
+        src2_value=SP_3_0,
     )
-    await RisingEdge(dut.i_clk)
     await FallingEdge(dut.i_clk)
 
     # Clear issue and assert flush
-    iface.drive_issue(valid=False, rob_tag=0, op=0, src1_value=0, src2_value=0)
+    iface.clear_issue()
     iface.drive_flush()
 
-    await RisingEdge(dut.i_clk)
     await FallingEdge(dut.i_clk)
 
     iface.clear_flush()
 
     # Wait enough cycles for the operation to have completed (if not flushed)
-    for _ in range(MAX_LATENCY):
-        await RisingEdge(dut.i_clk)
-        await FallingEdge(dut.i_clk)
-        result = iface.read_fu_complete()
-        assert not result["valid"], (
-            "Expected no valid output after flush, "
-            f"but got valid with tag={result['tag']}"
-        )
+    result = await wait_for_fu_complete(
+        dut.i_clk, iface.fu_complete_handle, MAX_LATENCY, CLOCK_PERIOD_NS
+    )
+    assert not result.valid, (
+        "Expected no valid output after flush, " f"but got valid with tag={result.tag}"
+    )
 
 
 # ============================================================================
@@ -297,19 +228,18 @@ async def test_back_to_back_fmul_s_tags(dut: Any) -> None:
             valid=True,
             rob_tag=tag,
             op=OP_FMUL_S,
-            src1_value=SRC_2_0,
-            src2_value=SRC_3_0,
+            src1_value=SP_2_0,
+            src2_value=SP_3_0,
         )
-        await RisingEdge(dut.i_clk)
         await FallingEdge(dut.i_clk)
         assert not iface.read_busy(), "credits should allow back-to-back FMUL issue"
 
-    iface.drive_issue(valid=False, rob_tag=0, op=0, src1_value=0, src2_value=0)
+    iface.clear_issue()
 
     results = await wait_for_completions(dut, iface, 4)
-    tags = [result["tag"] for result in results]
+    tags = [result.tag for result in results]
     assert tags == [8, 9, 10, 11], f"unexpected completion tags: {tags}"
     for result in results:
         assert (
-            result["value"] == RES_6_0
-        ), f"Expected NaN-boxed 6.0f (0x{RES_6_0:016X}), got 0x{result['value']:016X}"
+            result.value == SP_6_0
+        ), f"Expected NaN-boxed 6.0f (0x{SP_6_0:016X}), got 0x{result.value:016X}"
@@ -36,21 +36,43 @@ MASK32 = 0xFFFF_FFFF
 # ---------------------------------------------------------------------------
 _INSTR_OPS = _parse_instr_op_enum()
 
-
-def _op(name: str) -> int:
-    """Look up an instr_op_e value by name, raising KeyError on mismatch."""
-    return _INSTR_OPS[name]
+OP_ADD = _INSTR_OPS["ADD"]
+OP_ADDI = _INSTR_OPS["ADDI"]
+OP_AUIPC = _INSTR_OPS["AUIPC"]
+OP_BEQ = _INSTR_OPS["BEQ"]
+OP_BEXTI = _INSTR_OPS["BEXTI"]
+OP_BREV8 = _INSTR_OPS["BREV8"]
+OP_CSRRS = _INSTR_OPS["CSRRS"]
+OP_CZERO_EQZ = _INSTR_OPS["CZERO_EQZ"]
+OP_CZERO_NEZ = _INSTR_OPS["CZERO_NEZ"]
+OP_JAL = _INSTR_OPS["JAL"]
+OP_LUI = _INSTR_OPS["LUI"]
+OP_PACK = _INSTR_OPS["PACK"]
+OP_REV8 = _INSTR_OPS["REV8"]
+OP_SEXT_H = _INSTR_OPS["SEXT_H"]
+OP_SH2ADD = _INSTR_OPS["SH2ADD"]
+OP_SLLI = _INSTR_OPS["SLLI"]
+OP_SUB = _INSTR_OPS["SUB"]
 
 
 # ---------------------------------------------------------------------------
 # Common setup helper
 # ---------------------------------------------------------------------------
+# All tests in a module share one simulator run, so the interface (and the
+# handles it resolves) is built once and reused.  The clock is a test-scoped
+# task that cocotb cancels when each test ends, so it is restarted per test,
+# and every test still starts from a full reset.
+_iface: IntAluShimInterface | None = None
+
+
 async def setup(dut: Any) -> IntAluShimInterface:
-    """Start clock, reset DUT, and return the interface."""
-    cocotb.start_soon(Clock(dut.i_clk, CLOCK_PERIOD_NS, unit="ns").start())
-    iface = IntAluShimInterface(dut)
-    await iface.reset()
-    return iface
+    """Start clock, reset DUT, and return the shared interface."""
+    global _iface
+    cocotb.start_soon(Clock(dut.i_clk, CLOCK_PERIOD_NS, unit="ns", impl="gpi").start())
+    if _iface is None or _iface.dut is not dut:
+        _iface = IntAluShimInterface(dut)
+    await _iface.reset()
+    return _iface
 
 
 # ============================================================================
@@ -62,123 +84,47 @@ async def test_reset_state(dut: Any) -> None:
     iface = await setup(dut)
 
     result = iface.read_fu_complete()
-    assert result["valid"] is False, "fu_complete.valid should be 0 after reset"
+    assert result.valid is False, "fu_complete.valid should be 0 after reset"
     assert iface.read_busy() is False, "fu_busy should be 0 after reset"
 
 
 # ============================================================================
-# Test 2: ADD basic (10 + 20 = 30)
-# ============================================================================
-@cocotb.test()
-async def test_add_basic(dut: Any) -> None:
-    """ADD: 10 + 20 = 30 (register + register, use_imm=False)."""
-    iface = await setup(dut)
-
-    rob_tag = 1
-    iface.drive_issue(
-        valid=True,
-        rob_tag=rob_tag,
-        op=_op("ADD"),
-        src1_value=10,
-        src2_value=20,
-    )
-    await iface.step()
-
-    result = iface.read_fu_complete()
-    assert result["valid"] is True, "Expected valid completion"
-    assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert result["value"] == 30, f"Expected 30, got {result['value']}"
-    assert result["exception"] is False, "unexpected exception"
-    iface.clear_issue()
-
-
-# ============================================================================
-# Test 3: ADDI basic (100 + imm 50 = 150)
-# ============================================================================
-@cocotb.test()
-async def test_addi_basic(dut: Any) -> None:
-    """ADDI: 100 + imm(50) = 150 (use_imm=True)."""
-    iface = await setup(dut)
-
-    rob_tag = 2
-    iface.drive_issue(
-        valid=True,
-        rob_tag=rob_tag,
-        op=_op("ADDI"),
-        src1_value=100,
-        src2_value=0,
-        imm=50,
-        use_imm=True,
-    )
-    await iface.step()
-
-    result = iface.read_fu_complete()
-    assert result["valid"] is True, "Expected valid completion"
-    assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert result["value"] == 150, f"Expected 150, got {result['value']}"
-    assert result["exception"] is False, "unexpected exception"
-    iface.clear_issue()
-
-
-# ============================================================================
-# Test 4: SUB basic (50 - 30 = 20)
+# Tests 2-5: ADD / ADDI / SUB / SLLI basic
 # ============================================================================
-@cocotb.test()
-async def test_sub_basic(dut: Any) -> None:
-    """SUB: 50 - 30 = 20."""
-    iface = await setup(dut)
-
-    rob_tag = 3
-    iface.drive_issue(
-        valid=True,
-        rob_tag=rob_tag,
-        op=_op("SUB"),
-        src1_value=50,
-        src2_value=30,
-    )
-    await iface.step()
+# (rob_tag, op, src1, src2, imm, use_imm, expected)
+ARITH_CASES = [
+    (1, OP_ADD, 10, 20, 0, False, 30),
+    (2, OP_ADDI, 100, 0, 50, True, 150),
+    (3, OP_SUB, 50, 30, 0, False, 20),
+    # shift amount in imm[4:0]
+    (4, OP_SLLI, 1, 0, 4, True, 16),
+]
 
-    result = iface.read_fu_complete()
-    assert result["valid"] is True, "Expected valid completion"
-    assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert result["value"] == 20, f"Expected 20, got {result['value']}"
-    assert result["exception"] is False, "unexpected exception"
-    iface.clear_issue()
 
-
-# ============================================================================
-# Test 5: SLLI (1 << 4 = 16)
-# ============================================================================
 @cocotb.test()
-async def test_slli(dut: Any) -> None:
-    """SLLI: 1 << 4 = 16 (use_imm=True, shift amount in imm[4:0])."""
+async def test_arith_basic(dut: Any) -> None:
+    """ADD, ADDI, SUB and SLLI on consecutive cycles after a single reset."""
     iface = await setup(dut)
 
-    rob_tag = 4
-    iface.drive_issue(
-        valid=True,
-        rob_tag=rob_tag,
-        op=_op("SLLI"),
-        src1_value=1,
-        src2_value=0,
-        imm=4,
-        use_imm=True,
-    )
-    await iface.step()
-
-    result = iface.read_fu_complete()
-    assert result["valid"] is True, "Expected valid completion"
-    assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert result["value"] == 16, f"Expected 16, got {result['value']}"
-    assert result["exception"] is False, "unexpected exception"
+    for rob_tag, op, src1, src2, imm, use_imm, expected in ARITH_CASES:
+        iface.drive_issue(
+            valid=True,
+            rob_tag=rob_tag,
+            op=op,
+            src1_value=src1,
+            src2_value=src2,
+            imm=imm,
+            use_imm=use_imm,
+        )
+        await iface.step()
+
+        result = iface.read_fu_complete()
+        assert result.valid is True, f"tag {rob_tag}: expected valid completion"
+        assert result.tag == rob_tag, f"tag {rob_tag}: tag mismatch, got {result.tag}"
+        assert (
+            result.value == expected
+        ), f"tag {rob_tag}: expected {expected}, got {result.value}"
+        assert result.exception is False, f"tag {rob_tag}: unexpected exception"
     iface.clear_issue()
 
 
@@ -195,7 +141,7 @@ async def test_lui(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=rob_tag,
-        op=_op("LUI"),
+        op=OP_LUI,
         src1_value=0,
         src2_value=0,
         imm=imm_val,
@@ -203,14 +149,12 @@ async def test_lui(dut: Any) -> None:
     await iface.step()
 
     result = iface.read_fu_complete()
-    assert result["valid"] is True, "Expected valid completion"
-    assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
+    assert result.valid is True, "Expected valid completion"
+    assert result.tag == rob_tag, f"tag mismatch: got {result.tag}, expected {rob_tag}"
     assert (
-        result["value"] == imm_val
-    ), f"Expected 0x{imm_val:08X}, got 0x{result['value']:016X}"
-    assert result["exception"] is False, "unexpected exception"
+        result.value == imm_val
+    ), f"Expected 0x{imm_val:08X}, got 0x{result.value:016X}"
+    assert result.exception is False, "unexpected exception"
     iface.clear_issue()
 
 
@@ -230,7 +174,7 @@ async def test_auipc(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=rob_tag,
-        op=_op("AUIPC"),
+        op=OP_AUIPC,
         src1_value=0,
         src2_value=0,
         imm=imm_val,
@@ -239,14 +183,12 @@ async def test_auipc(dut: Any) -> None:
     await iface.step()
 
     result = iface.read_fu_complete()
-    assert result["valid"] is True, "Expected valid completion"
+    assert result.valid is True, "Expected valid completion"
+    assert result.tag == rob_tag, f"tag mismatch: got {result.tag}, expected {rob_tag}"
     assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert (
-        result["value"] == expected
-    ), f"Expected 0x{expected:08X}, got 0x{result['value']:016X}"
-    assert result["exception"] is False, "unexpected exception"
+        result.value == expected
+    ), f"Expected 0x{expected:08X}, got 0x{result.value:016X}"
+    assert result.exception is False, "unexpected exception"
     iface.clear_issue()
 
 
@@ -265,7 +207,7 @@ async def test_jal_link(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=rob_tag,
-        op=_op("JAL"),
+        op=OP_JAL,
         src1_value=0,
         src2_value=0,
         pc=pc_val,
@@ -274,14 +216,12 @@ async def test_jal_link(dut: Any) -> None:
     await iface.step()
 
     result = iface.read_fu_complete()
-    assert result["valid"] is True, "Expected valid completion"
-    assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
+    assert result.valid is True, "Expected valid completion"
+    assert result.tag == rob_tag, f"tag mismatch: got {result.tag}, expected {rob_tag}"
     assert (
-        result["value"] == link_addr
-    ), f"Expected 0x{link_addr:08X}, got 0x{result['value']:016X}"
-    assert result["exception"] is False, "unexpected exception"
+        result.value == link_addr
+    ), f"Expected 0x{link_addr:08X}, got 0x{result.value:016X}"
+    assert result.exception is False, "unexpected exception"
     iface.clear_issue()
 
 
@@ -297,21 +237,17 @@ async def test_sext_h(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=rob_tag,
-        op=_op("SEXT_H"),
+        op=OP_SEXT_H,
         src1_value=0x0000_8001,
         src2_value=0,
     )
     await iface.step()
 
     result = iface.read_fu_complete()
-    assert result["valid"] is True, "Expected valid completion"
-    assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert (
-        result["value"] == 0xFFFF_8001
-    ), f"Expected 0xFFFF8001, got 0x{result['value']:08X}"
-    assert result["exception"] is False, "unexpected exception"
+    assert result.valid is True, "Expected valid completion"
+    assert result.tag == rob_tag, f"tag mismatch: got {result.tag}, expected {rob_tag}"
+    assert result.value == 0xFFFF_8001, f"Expected 0xFFFF8001, got 0x{result.value:08X}"
+    assert result.exception is False, "unexpected exception"
     iface.clear_issue()
 
 
@@ -327,21 +263,17 @@ async def test_pack_zext_h(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=rob_tag,
-        op=_op("PACK"),
+        op=OP_PACK,
         src1_value=0xAABB_CCDD,
         src2_value=0,
     )
     await iface.step()
 
     result = iface.read_fu_complete()
-    assert result["valid"] is True, "Expected valid completion"
-    assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert (
-        result["value"] == 0x0000_CCDD
-    ), f"Expected 0x0000CCDD, got 0x{result['value']:08X}"
-    assert result["exception"] is False, "unexpected exception"
+    assert result.valid is True, "Expected valid completion"
+    assert result.tag == rob_tag, f"tag mismatch: got {result.tag}, expected {rob_tag}"
+    assert result.value == 0x0000_CCDD, f"Expected 0x0000CCDD, got 0x{result.value:08X}"
+    assert result.exception is False, "unexpected exception"
     iface.clear_issue()
 
 
@@ -357,19 +289,17 @@ async def test_sh2add(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=rob_tag,
-        op=_op("SH2ADD"),
+        op=OP_SH2ADD,
         src1_value=3,
         src2_value=4,
     )
     await iface.step()
 
     result = iface.read_fu_complete()
-    assert result["valid"] is True, "Expected valid completion"
-    assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert result["value"] == 16, f"Expected 16, got {result['value']}"
-    assert result["exception"] is False, "unexpected exception"
+    assert result.valid is True, "Expected valid completion"
+    assert result.tag == rob_tag, f"tag mismatch: got {result.tag}, expected {rob_tag}"
+    assert result.value == 16, f"Expected 16, got {result.value}"
+    assert result.exception is False, "unexpected exception"
     iface.clear_issue()
 
 
@@ -385,21 +315,17 @@ async def test_rev8(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=rob_tag,
-        op=_op("REV8"),
+        op=OP_REV8,
         src1_value=0x1122_3344,
         src2_value=0,
     )
     await iface.step()
 
     result = iface.read_fu_complete()
-    assert result["valid"] is True, "Expected valid completion"
-    assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert (
-        result["value"] == 0x4433_2211
-    ), f"Expected 0x44332211, got 0x{result['value']:08X}"
-    assert result["exception"] is False, "unexpected exception"
+    assert result.valid is True, "Expected valid completion"
+    assert result.tag == rob_tag, f"tag mismatch: got {result.tag}, expected {rob_tag}"
+    assert result.value == 0x4433_2211, f"Expected 0x44332211, got 0x{result.value:08X}"
+    assert result.exception is False, "unexpected exception"
     iface.clear_issue()
 
 
@@ -415,21 +341,17 @@ async def test_brev8(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=rob_tag,
-        op=_op("BREV8"),
+        op=OP_BREV8,
         src1_value=0x0123_4567,
         src2_value=0,
     )
     await iface.step()
 
     result = iface.read_fu_complete()
-    assert result["valid"] is True, "Expected valid completion"
-    assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert (
-        result["value"] == 0x80C4_A2E6
-    ), f"Expected 0x80C4A2E6, got 0x{result['value']:08X}"
-    assert result["exception"] is False, "unexpected exception"
+    assert result.valid is True, "Expected valid completion"
+    assert result.tag == rob_tag, f"tag mismatch: got {result.tag}, expected {rob_tag}"
+    assert result.value == 0x80C4_A2E6, f"Expected 0x80C4A2E6, got 0x{result.value:08X}"
+    assert result.exception is False, "unexpected exception"
     iface.clear_issue()
 
 
@@ -445,7 +367,7 @@ async def test_bexti(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=rob_tag,
-        op=_op("BEXTI"),
+        op=OP_BEXTI,
         src1_value=0x0000_0080,
         src2_value=0,
         imm=7,
@@ -454,12 +376,10 @@ async def test_bexti(dut: Any) -> None:
     await iface.step()
 
     result = iface.read_fu_complete()
-    assert result["valid"] is True, "Expected valid completion"
-    assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert result["value"] == 1, f"Expected 1, got {result['value']}"
-    assert result["exception"] is False, "unexpected exception"
+    assert result.valid is True, "Expected valid completion"
+    assert result.tag == rob_tag, f"tag mismatch: got {result.tag}, expected {rob_tag}"
+    assert result.value == 1, f"Expected 1, got {result.value}"
+    assert result.exception is False, "unexpected exception"
     iface.clear_issue()
 
 
@@ -475,19 +395,17 @@ async def test_czero_eqz(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=rob_tag,
-        op=_op("CZERO_EQZ"),
+        op=OP_CZERO_EQZ,
         src1_value=0x1234_5678,
         src2_value=0,
     )
     await iface.step()
 
     result = iface.read_fu_complete()
-    assert result["valid"] is True, "Expected valid completion"
-    assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert result["value"] == 0, f"Expected 0, got 0x{result['value']:08X}"
-    assert result["exception"] is False, "unexpected exception"
+    assert result.valid is True, "Expected valid completion"
+    assert result.tag == rob_tag, f"tag mismatch: got {result.tag}, expected {rob_tag}"
+    assert result.value == 0, f"Expected 0, got 0x{result.value:08X}"
+    assert result.exception is False, "unexpected exception"
     iface.clear_issue()
 
 
@@ -503,19 +421,17 @@ async def test_czero_nez(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=rob_tag,
-        op=_op("CZERO_NEZ"),
+        op=OP_CZERO_NEZ,
         src1_value=0x89AB_CDEF,
         src2_value=5,
     )
     await iface.step()
 
     result = iface.read_fu_complete()
-    assert result["valid"] is True, "Expected valid completion"
-    assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert result["value"] == 0, f"Expected 0, got 0x{result['value']:08X}"
-    assert result["exception"] is False, "unexpected exception"
+    assert result.valid is True, "Expected valid completion"
+    assert result.tag == rob_tag, f"tag mismatch: got {result.tag}, expected {rob_tag}"
+    assert result.value == 0, f"Expected 0, got 0x{result.value:08X}"
+    assert result.exception is False, "unexpected exception"
     iface.clear_issue()
 
 
@@ -531,21 +447,17 @@ async def test_pack_general(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=rob_tag,
-        op=_op("PACK"),
+        op=OP_PACK,
         src1_value=0xAABB_CCDD,
         src2_value=0x1122_3344,
     )
     await iface.step()
 
     result = iface.read_fu_complete()
-    assert result["valid"] is True, "Expected valid completion"
-    assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert (
-        result["value"] == 0x3344_CCDD
-    ), f"Expected 0x3344CCDD, got 0x{result['value']:08X}"
-    assert result["exception"] is False, "unexpected exception"
+    assert result.valid is True, "Expected valid completion"
+    assert result.tag == rob_tag, f"tag mismatch: got {result.tag}, expected {rob_tag}"
+    assert result.value == 0x3344_CCDD, f"Expected 0x3344CCDD, got 0x{result.value:08X}"
+    assert result.exception is False, "unexpected exception"
     iface.clear_issue()
 
 
@@ -563,7 +475,7 @@ async def test_never_busy(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=8,
-        op=_op("ADD"),
+        op=OP_ADD,
         src1_value=1,
         src2_value=2,
     )
@@ -586,7 +498,7 @@ async def test_branch_no_valid(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=13,
-        op=_op("BEQ"),
+        op=OP_BEQ,
         src1_value=42,
         src2_value=42,
     )
@@ -594,7 +506,7 @@ async def test_branch_no_valid(dut: Any) -> None:
 
     result = iface.read_fu_complete()
     assert (
-        result["valid"] is False
+        result.valid is False
     ), "BEQ should not produce valid writeback (branch resolution is separate)"
     iface.clear_issue()
 
@@ -613,19 +525,17 @@ async def test_csr_read(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=rob_tag,
-        op=_op("CSRRS"),
+        op=OP_CSRRS,
         src1_value=rs1_val,
         src2_value=0,
     )
     await iface.step()
 
     result = iface.read_fu_complete()
-    assert result["valid"] is True, "Expected valid completion for CSRRS"
-    assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
+    assert result.valid is True, "Expected valid completion for CSRRS"
+    assert result.tag == rob_tag, f"tag mismatch: got {result.tag}, expected {rob_tag}"
     assert (
-        result["value"] == rs1_val
-    ), f"Expected 0x{rs1_val:08X}, got 0x{result['value']:016X}"
-    assert result["exception"] is False, "unexpected exception"
+        result.value == rs1_val
+    ), f"Expected 0x{rs1_val:08X}, got 0x{result.value:016X}"
+    assert result.exception is False, "unexpected exception"
     iface.clear_issue()
@@ -18,18 +18,41 @@ Tests MUL, MULH, MULHSU, MULHU, DIV, DIVU, REM, REMU operations,
 divide-by-zero, signed overflow, busy signalling, and full/partial
 flush behavior.  MUL has ~4-cycle latency, DIV has ~17-cycle latency,
 so tests poll for completion.
+
+Like the other unit benches this runs under Verilator only (tests/Makefile
+pins ``SIM := verilator``); the per-cycle polling and watcher tasks here
+rely on its cheap callbacks and would be far slower on an event-driven
+commercial simulator.
 """
 
+from collections.abc import Callable
 from typing import Any
 
 import cocotb
 from cocotb.clock import Clock
-from cocotb.triggers import FallingEdge, RisingEdge
-
-from .fp_add_shim_interface import _parse_instr_op_enum
+from cocotb.triggers import (
+    ClockCycles,
+    Combine,
+    FallingEdge,
+    ReadOnly,
+    RisingEdge,
+)
+from models.alu_model import DivisionOperations, mul, mulh, mulhsu, mulhu
+
+from .fp_add_shim_interface import (
+    FuComplete,
+    _parse_instr_op_enum,
+    expect_no_fu_complete,
+    fu_complete_valid,
+    unpack_fu_complete,
+    wait_for_fu_complete,
+)
 from .int_muldiv_shim_interface import IntMulDivShimInterface
 
-CLOCK_PERIOD_NS = 10
+# Every wait in this bench is edge- or cycle-relative (Timer windows are
+# scaled by this constant), so the absolute period is arbitrary; keep it
+# short to shrink simulated time for the ~17-cycle divides.
+CLOCK_PERIOD_NS = 2
 
 MASK32 = 0xFFFF_FFFF
 
@@ -41,36 +64,50 @@ MAX_LATENCY = 50
 # ---------------------------------------------------------------------------
 _INSTR_OPS = _parse_instr_op_enum()
 
-
-def _op(name: str) -> int:
-    """Look up an instr_op_e value by name, raising KeyError on mismatch."""
-    return _INSTR_OPS[name]
+OP_DIV = _INSTR_OPS["DIV"]
+OP_DIVU = _INSTR_OPS["DIVU"]
+OP_MUL = _INSTR_OPS["MUL"]
+OP_MULH = _INSTR_OPS["MULH"]
+OP_MULHSU = _INSTR_OPS["MULHSU"]
+OP_MULHU = _INSTR_OPS["MULHU"]
+OP_REM = _INSTR_OPS["REM"]
+OP_REMU = _INSTR_OPS["REMU"]
 
 
 # ---------------------------------------------------------------------------
 # Common helpers
 # ---------------------------------------------------------------------------
+# All tests in a module share one simulator run, so the interface (and the
+# handles it resolves) is built once and reused.  The clock is a test-scoped
+# task that cocotb cancels when each test ends, so it is restarted per test,
+# and every test still starts from a full reset.
+_iface: IntMulDivShimInterface | None = None
+
+
 async def setup(dut: Any) -> IntMulDivShimInterface:
-    """Start clock, reset DUT, and return the interface."""
-    cocotb.start_soon(Clock(dut.i_clk, CLOCK_PERIOD_NS, unit="ns").start())
-    iface = IntMulDivShimInterface(dut)
-    await iface.reset()
-    return iface
+    """Start clock, reset DUT, and return the shared interface."""
+    global _iface
+    cocotb.start_soon(Clock(dut.i_clk, CLOCK_PERIOD_NS, unit="ns", impl="gpi").start())
+    if _iface is None or _iface.dut is not dut:
+        _iface = IntMulDivShimInterface(dut)
+    await _iface.reset()
+    return _iface
 
 
 async def wait_for_mul_complete(
     iface: IntMulDivShimInterface, max_cycles: int = MAX_LATENCY
-) -> dict:
+) -> FuComplete:
     """Wait until o_mul_fu_complete.valid is asserted, return the result.
 
     Raises AssertionError if valid is not seen within max_cycles.
     """
-    for _ in range(max_cycles):
-        await RisingEdge(iface.clock)
-        await FallingEdge(iface.clock)
-        result = iface.read_mul_fu_complete()
-        if result["valid"]:
-            return result
+    result = await wait_for_fu_complete(
+        iface.clock, iface.mul_fu_complete_handle, max_cycles, CLOCK_PERIOD_NS
+    )
+    # Resume on the falling edge of the completing cycle, as callers expect.
+    await FallingEdge(iface.clock)
+    if result.valid:
+        return result
     raise AssertionError(
         f"mul_fu_complete.valid not asserted within {max_cycles} cycles"
     )
@@ -78,7 +115,7 @@ async def wait_for_mul_complete(
 
 async def wait_for_div_complete(
     iface: IntMulDivShimInterface, max_cycles: int = MAX_LATENCY
-) -> dict:
+) -> FuComplete:
     """Wait until o_div_fu_complete.valid is asserted, return the result.
 
     After capturing a valid result, drives i_div_accepted for one cycle
@@ -86,17 +123,15 @@ async def wait_for_div_complete(
 
     Raises AssertionError if valid is not seen within max_cycles.
     """
-    for _ in range(max_cycles):
-        await RisingEdge(iface.clock)
+    result = await wait_for_fu_complete(
+        iface.clock, iface.div_fu_complete_handle, max_cycles, CLOCK_PERIOD_NS
+    )
+    await FallingEdge(iface.clock)
+    if result.valid:
+        # Pop the FIFO entry
+        await iface.pulse_div_accepted()
         await FallingEdge(iface.clock)
-        result = iface.read_div_fu_complete()
-        if result["valid"]:
-            # Pop the FIFO entry
-            iface.drive_div_accepted()
-            await RisingEdge(iface.clock)
-            iface.clear_div_accepted()
-            await FallingEdge(iface.clock)
-            return result
+        return result
     raise AssertionError(
         f"div_fu_complete.valid not asserted within {max_cycles} cycles"
     )
@@ -112,221 +147,116 @@ async def test_reset_state(dut: Any) -> None:
 
     mul_result = iface.read_mul_fu_complete()
     div_result = iface.read_div_fu_complete()
-    assert mul_result["valid"] is False, "mul valid should be 0 after reset"
-    assert div_result["valid"] is False, "div valid should be 0 after reset"
+    assert mul_result.valid is False, "mul valid should be 0 after reset"
+    assert div_result.valid is False, "div valid should be 0 after reset"
     assert iface.read_busy() is False, "busy should be 0 after reset"
 
 
 # ============================================================================
-# Test 2: MUL basic (7 * 6 = 42, low 32 bits)
-# ============================================================================
-@cocotb.test()
-async def test_mul_basic(dut: Any) -> None:
-    """MUL: 7 * 6 = 42 (low 32 bits of product)."""
-    iface = await setup(dut)
-
-    rob_tag = 1
-    iface.drive_issue(
-        valid=True,
-        rob_tag=rob_tag,
-        op=_op("MUL"),
-        src1_value=7,
-        src2_value=6,
-    )
-    await RisingEdge(iface.clock)
-    iface.clear_issue()
-
-    result = await wait_for_mul_complete(iface)
-    assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert result["value"] == 42, f"Expected 42, got {result['value']}"
-    assert result["exception"] is False, "unexpected exception"
-
-
-# ============================================================================
-# Test 3: MULH basic (signed * signed, high 32 bits)
-# ============================================================================
-@cocotb.test()
-async def test_mulh_basic(dut: Any) -> None:
-    """MULH: 0x7FFFFFFF * 0x7FFFFFFF, high 32 bits = 0x3FFFFFFF."""
-    iface = await setup(dut)
-
-    rob_tag = 2
-    src1 = 0x7FFF_FFFF  # 2147483647
-    src2 = 0x7FFF_FFFF  # 2147483647
-    # Product = 2147483647^2 = 0x3FFFFFFF_00000001
-    expected_high = 0x3FFF_FFFF
-
-    iface.drive_issue(
-        valid=True,
-        rob_tag=rob_tag,
-        op=_op("MULH"),
-        src1_value=src1,
-        src2_value=src2,
-    )
-    await RisingEdge(iface.clock)
-    iface.clear_issue()
-
-    result = await wait_for_mul_complete(iface)
-    assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert (
-        result["value"] == expected_high
-    ), f"Expected 0x{expected_high:08X}, got 0x{result['value']:016X}"
-
-
-# ============================================================================
-# Test 4: MULHSU basic (signed * unsigned, high 32 bits)
-# ============================================================================
-@cocotb.test()
-async def test_mulhsu_basic(dut: Any) -> None:
-    """MULHSU: (-1) * 2 unsigned, high 32 bits = 0xFFFFFFFF."""
-    iface = await setup(dut)
-
-    rob_tag = 3
-    src1 = 0xFFFF_FFFF  # -1 as signed 32-bit
-    src2 = 0x0000_0002  # 2 as unsigned
-    # Signed(-1) * Unsigned(2) = -2, 64-bit = 0xFFFFFFFF_FFFFFFFE
-    expected_high = 0xFFFF_FFFF
-
-    iface.drive_issue(
-        valid=True,
-        rob_tag=rob_tag,
-        op=_op("MULHSU"),
-        src1_value=src1,
-        src2_value=src2,
-    )
-    await RisingEdge(iface.clock)
-    iface.clear_issue()
-
-    result = await wait_for_mul_complete(iface)
-    assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert (
-        result["value"] == expected_high
-    ), f"Expected 0x{expected_high:08X}, got 0x{result['value']:016X}"
-
-
-# ============================================================================
-# Test 5: MULHU basic (unsigned * unsigned, high 32 bits)
-# ============================================================================
-@cocotb.test()
-async def test_mulhu_basic(dut: Any) -> None:
-    """MULHU: 0xFFFFFFFF * 0xFFFFFFFF, high 32 bits = 0xFFFFFFFE."""
-    iface = await setup(dut)
-
-    rob_tag = 4
-    src1 = 0xFFFF_FFFF
-    src2 = 0xFFFF_FFFF
+# Tests 2-8, 13: MUL / MULH / MULHSU / MULHU / DIV / DIVU / REM / REMU basic
+# ============================================================================
+# Expected results come from the RV32M reference model in models.alu_model.
+_REFERENCE: dict[int, Callable[[int, int], int]] = {
+    OP_MUL: mul,
+    OP_MULH: mulh,
+    OP_MULHSU: mulhsu,
+    OP_MULHU: mulhu,
+    OP_DIV: DivisionOperations.div,
+    OP_DIVU: DivisionOperations.divu,
+    OP_REM: DivisionOperations.rem,
+    OP_REMU: DivisionOperations.remu,
+}
+
+# (rob_tag, op, src1, src2) -- MUL returns the low 32 bits of the product,
+# the MULH* variants the high 32 bits.
+MUL_CASES = [
+    (1, OP_MUL, 7, 6),  # 42
+    # 0x7FFFFFFF^2 = 0x3FFFFFFF_00000001
+    (2, OP_MULH, 0x7FFF_FFFF, 0x7FFF_FFFF),
+    # signed(-1) * unsigned(2) = -2 = 0xFFFFFFFF_FFFFFFFE
+    (3, OP_MULHSU, 0xFFFF_FFFF, 0x0000_0002),
     # (2^32-1)^2 = 0xFFFFFFFE_00000001
-    expected_high = 0xFFFF_FFFE
-
-    iface.drive_issue(
-        valid=True,
-        rob_tag=rob_tag,
-        op=_op("MULHU"),
-        src1_value=src1,
-        src2_value=src2,
-    )
-    await RisingEdge(iface.clock)
-    iface.clear_issue()
-
-    result = await wait_for_mul_complete(iface)
-    assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert (
-        result["value"] == expected_high
-    ), f"Expected 0x{expected_high:08X}, got 0x{result['value']:016X}"
+    (4, OP_MULHU, 0xFFFF_FFFF, 0xFFFF_FFFF),
+]
+
+# (rob_tag, op, src1, src2)
+DIV_CASES = [
+    (5, OP_DIV, 42, 7),  # 6
+    # 4294967294 / 2 unsigned = 0x7FFFFFFF
+    (6, OP_DIVU, 0xFFFF_FFFE, 2),
+    (7, OP_REM, 43, 7),  # 1
+    (8, OP_REMU, 43, 7),  # 1
+]
+
+
+async def collect_completions(
+    iface: IntMulDivShimInterface, handle: Any, count: int, pop_div: bool
+) -> dict[int, FuComplete]:
+    """Sample *handle* every cycle until *count* results are seen, keyed by tag.
+
+    MUL results pop on their own (i_mul_accepted is held high); for the DIV
+    port pass ``pop_div=True`` so each captured head is popped before the
+    next one is read.
+    """
+    results: dict[int, FuComplete] = {}
+    for _ in range(MAX_LATENCY + 2 * count):
+        await RisingEdge(iface.clock)
+        await ReadOnly()
+        raw = int(handle.value)
+        if not fu_complete_valid(raw):
+            continue
+        result = unpack_fu_complete(raw)
+        results[result.tag] = result
+        if len(results) == count:
+            return results
+        if pop_div:
+            await FallingEdge(iface.clock)
+            await iface.pulse_div_accepted()
+    raise AssertionError(f"only saw {len(results)} of {count} expected completions")
 
 
-# ============================================================================
-# Test 6: DIV basic (42 / 7 = 6)
-# ============================================================================
 @cocotb.test()
-async def test_div_basic(dut: Any) -> None:
-    """DIV: 42 / 7 = 6 (signed divide)."""
-    iface = await setup(dut)
-
-    rob_tag = 5
-    iface.drive_issue(
-        valid=True,
-        rob_tag=rob_tag,
-        op=_op("DIV"),
-        src1_value=42,
-        src2_value=7,
-    )
-    await RisingEdge(iface.clock)
-    iface.clear_issue()
-
-    result = await wait_for_div_complete(iface)
-    assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert result["value"] == 6, f"Expected 6, got {result['value']}"
-    assert result["exception"] is False, "unexpected exception"
+async def test_arith_stream(dut: Any) -> None:
+    """Stream every MUL and DIV-class op back to back from a single reset.
 
-
-# ============================================================================
-# Test 7: DIVU basic (unsigned divide)
-# ============================================================================
-@cocotb.test()
-async def test_divu_basic(dut: Any) -> None:
-    """DIVU: 0xFFFFFFFE / 2 = 0x7FFFFFFF (unsigned divide)."""
+    Ops alternate between the two units on consecutive cycles (each unit
+    stays within its four credits), and both completion ports are collected
+    concurrently, so the basic cases share one reset and overlap in flight.
+    """
     iface = await setup(dut)
 
-    rob_tag = 6
-    src1 = 0xFFFF_FFFE  # 4294967294 unsigned
-    src2 = 2
-    expected = 0x7FFF_FFFF  # 2147483647
-
-    iface.drive_issue(
-        valid=True,
-        rob_tag=rob_tag,
-        op=_op("DIVU"),
-        src1_value=src1,
-        src2_value=src2,
+    mul_task = cocotb.start_soon(
+        collect_completions(
+            iface, iface.mul_fu_complete_handle, len(MUL_CASES), pop_div=False
+        )
     )
-    await RisingEdge(iface.clock)
-    iface.clear_issue()
-
-    result = await wait_for_div_complete(iface)
-    assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert (
-        result["value"] == expected
-    ), f"Expected 0x{expected:08X}, got 0x{result['value']:016X}"
-
-
-# ============================================================================
-# Test 8: REM basic (43 % 7 = 1)
-# ============================================================================
-@cocotb.test()
-async def test_rem_basic(dut: Any) -> None:
-    """REM: 43 % 7 = 1 (signed remainder)."""
-    iface = await setup(dut)
-
-    rob_tag = 7
-    iface.drive_issue(
-        valid=True,
-        rob_tag=rob_tag,
-        op=_op("REM"),
-        src1_value=43,
-        src2_value=7,
+    div_task = cocotb.start_soon(
+        collect_completions(
+            iface, iface.div_fu_complete_handle, len(DIV_CASES), pop_div=True
+        )
     )
-    await RisingEdge(iface.clock)
+
+    for mul_case, div_case in zip(MUL_CASES, DIV_CASES):
+        for rob_tag, op, src1, src2 in (mul_case, div_case):
+            iface.drive_issue(
+                valid=True,
+                rob_tag=rob_tag,
+                op=op,
+                src1_value=src1,
+                src2_value=src2,
+            )
+            await RisingEdge(iface.clock)
     iface.clear_issue()
 
-    result = await wait_for_div_complete(iface)
-    assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert result["value"] == 1, f"Expected 1, got {result['value']}"
-    assert result["exception"] is False, "unexpected exception"
+    await Combine(mul_task, div_task)
+    results = {**mul_task.result(), **div_task.result()}
+    for rob_tag, op, src1, src2 in MUL_CASES + DIV_CASES:
+        expected = _REFERENCE[op](src1, src2)
+        result = results[rob_tag]
+        assert (
+            result.value == expected
+        ), f"tag {rob_tag}: expected 0x{expected:08X}, got 0x{result.value:016X}"
+        assert result.exception is False, f"tag {rob_tag}: unexpected exception"
 
 
 # ============================================================================
@@ -342,7 +272,7 @@ async def test_single_mul_not_busy(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=8,
-        op=_op("MUL"),
+        op=OP_MUL,
         src1_value=7,
         src2_value=6,
     )
@@ -354,8 +284,7 @@ async def test_single_mul_not_busy(dut: Any) -> None:
     assert not iface.read_busy(), "busy should be 0 with one MUL in-flight"
 
     # Wait for completion
-    result = await wait_for_mul_complete(iface)
-    assert result["valid"], "Expected valid completion"
+    await wait_for_mul_complete(iface)
 
     # After completion cycle, busy should drop on the next cycle
     await iface.step()
@@ -375,7 +304,7 @@ async def test_single_div_not_busy(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=9,
-        op=_op("DIV"),
+        op=OP_DIV,
         src1_value=42,
         src2_value=7,
     )
@@ -388,8 +317,7 @@ async def test_single_div_not_busy(dut: Any) -> None:
 
     # Wait for completion
     result = await wait_for_div_complete(iface)
-    assert result["valid"], "Expected valid completion"
-    assert result["value"] == 6, f"Expected 6, got {result['value']}"
+    assert result.value == 6, f"Expected 6, got {result.value}"
 
 
 # ============================================================================
@@ -403,7 +331,7 @@ async def test_flush_clears_mul(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=10,
-        op=_op("MUL"),
+        op=OP_MUL,
         src1_value=7,
         src2_value=6,
     )
@@ -414,14 +342,11 @@ async def test_flush_clears_mul(dut: Any) -> None:
     iface.drive_flush()
     await RisingEdge(iface.clock)
     iface.clear_flush()
-    await FallingEdge(iface.clock)
 
     # Wait for the multiplier to finish; result should be suppressed
-    for _ in range(MAX_LATENCY):
-        await RisingEdge(iface.clock)
-        await FallingEdge(iface.clock)
-        result = iface.read_mul_fu_complete()
-        assert result["valid"] is False, "MUL result should be suppressed after flush"
+    await expect_no_fu_complete(
+        iface.mul_fu_complete_handle, MAX_LATENCY * CLOCK_PERIOD_NS
+    )
 
 
 # ============================================================================
@@ -435,7 +360,7 @@ async def test_flush_clears_div(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=11,
-        op=_op("DIV"),
+        op=OP_DIV,
         src1_value=42,
         src2_value=7,
     )
@@ -443,47 +368,17 @@ async def test_flush_clears_div(dut: Any) -> None:
     iface.clear_issue()
 
     # Let it run a few cycles
-    for _ in range(3):
-        await RisingEdge(iface.clock)
+    await ClockCycles(iface.clock, 3)
 
     # Assert full flush
     iface.drive_flush()
     await RisingEdge(iface.clock)
     iface.clear_flush()
-    await FallingEdge(iface.clock)
 
     # Wait for the divider to finish; result should be suppressed
-    for _ in range(MAX_LATENCY):
-        await RisingEdge(iface.clock)
-        await FallingEdge(iface.clock)
-        result = iface.read_div_fu_complete()
-        assert result["valid"] is False, "DIV result should be suppressed after flush"
-
-
-# ============================================================================
-# Test 13: REMU basic (unsigned remainder)
-# ============================================================================
-@cocotb.test()
-async def test_remu_basic(dut: Any) -> None:
-    """REMU: 43 % 7 = 1 (unsigned remainder)."""
-    iface = await setup(dut)
-
-    rob_tag = 12
-    iface.drive_issue(
-        valid=True,
-        rob_tag=rob_tag,
-        op=_op("REMU"),
-        src1_value=43,
-        src2_value=7,
+    await expect_no_fu_complete(
+        iface.div_fu_complete_handle, MAX_LATENCY * CLOCK_PERIOD_NS
     )
-    await RisingEdge(iface.clock)
-    iface.clear_issue()
-
-    result = await wait_for_div_complete(iface)
-    assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert result["value"] == 1, f"Expected 1, got {result['value']}"
 
 
 # ============================================================================
@@ -498,7 +393,7 @@ async def test_div_by_zero(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=rob_tag,
-        op=_op("DIV"),
+        op=OP_DIV,
         src1_value=42,
         src2_value=0,
     )
@@ -506,12 +401,10 @@ async def test_div_by_zero(dut: Any) -> None:
     iface.clear_issue()
 
     result = await wait_for_div_complete(iface)
+    assert result.tag == rob_tag, f"tag mismatch: got {result.tag}, expected {rob_tag}"
     assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert (
-        result["value"] == MASK32
-    ), f"DIV by zero should return 0xFFFFFFFF, got 0x{result['value']:08X}"
+        result.value == MASK32
+    ), f"DIV by zero should return 0xFFFFFFFF, got 0x{result.value:08X}"
 
 
 # ============================================================================
@@ -526,7 +419,7 @@ async def test_divu_by_zero(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=rob_tag,
-        op=_op("DIVU"),
+        op=OP_DIVU,
         src1_value=100,
         src2_value=0,
     )
@@ -534,12 +427,10 @@ async def test_divu_by_zero(dut: Any) -> None:
     iface.clear_issue()
 
     result = await wait_for_div_complete(iface)
+    assert result.tag == rob_tag, f"tag mismatch: got {result.tag}, expected {rob_tag}"
     assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert (
-        result["value"] == MASK32
-    ), f"DIVU by zero should return 0xFFFFFFFF, got 0x{result['value']:08X}"
+        result.value == MASK32
+    ), f"DIVU by zero should return 0xFFFFFFFF, got 0x{result.value:08X}"
 
 
 # ============================================================================
@@ -555,7 +446,7 @@ async def test_rem_by_zero(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=rob_tag,
-        op=_op("REM"),
+        op=OP_REM,
         src1_value=dividend,
         src2_value=0,
     )
@@ -563,12 +454,10 @@ async def test_rem_by_zero(dut: Any) -> None:
     iface.clear_issue()
 
     result = await wait_for_div_complete(iface)
+    assert result.tag == rob_tag, f"tag mismatch: got {result.tag}, expected {rob_tag}"
     assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert (
-        result["value"] == dividend
-    ), f"REM by zero should return dividend ({dividend}), got {result['value']}"
+        result.value == dividend
+    ), f"REM by zero should return dividend ({dividend}), got {result.value}"
 
 
 # ============================================================================
@@ -585,7 +474,7 @@ async def test_rem_by_zero_negative_dividend(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=rob_tag,
-        op=_op("REM"),
+        op=OP_REM,
         src1_value=dividend,
         src2_value=0,
     )
@@ -593,12 +482,10 @@ async def test_rem_by_zero_negative_dividend(dut: Any) -> None:
     iface.clear_issue()
 
     result = await wait_for_div_complete(iface)
+    assert result.tag == rob_tag, f"tag mismatch: got {result.tag}, expected {rob_tag}"
     assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert (
-        result["value"] == dividend
-    ), f"REM by zero (negative) should return 0x{dividend:08X}, got 0x{result['value']:08X}"
+        result.value == dividend
+    ), f"REM by zero (negative) should return 0x{dividend:08X}, got 0x{result.value:08X}"
 
 
 # ============================================================================
@@ -616,7 +503,7 @@ async def test_div_signed_overflow(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=rob_tag,
-        op=_op("DIV"),
+        op=OP_DIV,
         src1_value=min_int,
         src2_value=neg_one,
     )
@@ -624,12 +511,10 @@ async def test_div_signed_overflow(dut: Any) -> None:
     iface.clear_issue()
 
     result = await wait_for_div_complete(iface)
+    assert result.tag == rob_tag, f"tag mismatch: got {result.tag}, expected {rob_tag}"
     assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert (
-        result["value"] == min_int
-    ), f"DIV overflow should return 0x80000000, got 0x{result['value']:08X}"
+        result.value == min_int
+    ), f"DIV overflow should return 0x80000000, got 0x{result.value:08X}"
 
 
 # ============================================================================
@@ -647,7 +532,7 @@ async def test_rem_signed_overflow(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=rob_tag,
-        op=_op("REM"),
+        op=OP_REM,
         src1_value=min_int,
         src2_value=neg_one,
     )
@@ -655,12 +540,8 @@ async def test_rem_signed_overflow(dut: Any) -> None:
     iface.clear_issue()
 
     result = await wait_for_div_complete(iface)
-    assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert (
-        result["value"] == 0
-    ), f"REM overflow should return 0, got 0x{result['value']:08X}"
+    assert result.tag == rob_tag, f"tag mismatch: got {result.tag}, expected {rob_tag}"
+    assert result.value == 0, f"REM overflow should return 0, got 0x{result.value:08X}"
 
 
 # ============================================================================
@@ -675,7 +556,7 @@ async def test_partial_flush_suppresses_younger(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=10,
-        op=_op("MUL"),
+        op=OP_MUL,
         src1_value=7,
         src2_value=6,
     )
@@ -686,16 +567,11 @@ async def test_partial_flush_suppresses_younger(dut: Any) -> None:
     iface.drive_partial_flush(flush_tag=5, head_tag=0)
     await RisingEdge(iface.clock)
     iface.clear_partial_flush()
-    await FallingEdge(iface.clock)
 
     # Wait for multiplier to finish; result should be suppressed
-    for _ in range(MAX_LATENCY):
-        await RisingEdge(iface.clock)
-        await FallingEdge(iface.clock)
-        result = iface.read_mul_fu_complete()
-        assert (
-            result["valid"] is False
-        ), "MUL result should be suppressed after partial flush of younger tag"
+    await expect_no_fu_complete(
+        iface.mul_fu_complete_handle, MAX_LATENCY * CLOCK_PERIOD_NS
+    )
 
 
 # ============================================================================
@@ -711,7 +587,7 @@ async def test_partial_flush_keeps_older(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=rob_tag,
-        op=_op("MUL"),
+        op=OP_MUL,
         src1_value=7,
         src2_value=6,
     )
@@ -725,11 +601,8 @@ async def test_partial_flush_keeps_older(dut: Any) -> None:
 
     # Result should still appear
     result = await wait_for_mul_complete(iface)
-    assert result["valid"], "MUL result should NOT be suppressed (tag is older)"
-    assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert result["value"] == 42, f"Expected 42, got {result['value']}"
+    assert result.tag == rob_tag, f"tag mismatch: got {result.tag}, expected {rob_tag}"
+    assert result.value == 42, f"Expected 42, got {result.value}"
 
 
 # ============================================================================
@@ -744,7 +617,7 @@ async def test_partial_flush_suppresses_younger_div(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=10,
-        op=_op("DIV"),
+        op=OP_DIV,
         src1_value=42,
         src2_value=7,
     )
@@ -755,16 +628,11 @@ async def test_partial_flush_suppresses_younger_div(dut: Any) -> None:
     iface.drive_partial_flush(flush_tag=5, head_tag=0)
     await RisingEdge(iface.clock)
     iface.clear_partial_flush()
-    await FallingEdge(iface.clock)
 
     # Wait for divider to finish; result should be suppressed
-    for _ in range(MAX_LATENCY):
-        await RisingEdge(iface.clock)
-        await FallingEdge(iface.clock)
-        result = iface.read_div_fu_complete()
-        assert (
-            result["valid"] is False
-        ), "DIV result should be suppressed after partial flush of younger tag"
+    await expect_no_fu_complete(
+        iface.div_fu_complete_handle, MAX_LATENCY * CLOCK_PERIOD_NS
+    )
 
 
 # ============================================================================
@@ -780,7 +648,7 @@ async def test_partial_flush_keeps_older_div(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=rob_tag,
-        op=_op("DIV"),
+        op=OP_DIV,
         src1_value=42,
         src2_value=7,
     )
@@ -794,11 +662,8 @@ async def test_partial_flush_keeps_older_div(dut: Any) -> None:
 
     # Result should still appear
     result = await wait_for_div_complete(iface)
-    assert result["valid"], "DIV result should NOT be suppressed (tag is older)"
-    assert (
-        result["tag"] == rob_tag
-    ), f"tag mismatch: got {result['tag']}, expected {rob_tag}"
-    assert result["value"] == 6, f"Expected 6, got {result['value']}"
+    assert result.tag == rob_tag, f"tag mismatch: got {result.tag}, expected {rob_tag}"
+    assert result.value == 6, f"Expected 6, got {result.value}"
 
 
 # ============================================================================
@@ -821,7 +686,7 @@ async def test_back_to_back_div(dut: Any) -> None:
         iface.drive_issue(
             valid=True,
             rob_tag=tc["rob_tag"],
-            op=_op("DIV"),
+            op=OP_DIV,
             src1_value=tc["dividend"],
             src2_value=tc["divisor"],
         )
@@ -834,11 +699,11 @@ async def test_back_to_back_div(dut: Any) -> None:
     for tc in test_cases:
         result = await wait_for_div_complete(iface)
         assert (
-            result["tag"] == tc["rob_tag"]
-        ), f"tag mismatch: got {result['tag']}, expected {tc['rob_tag']}"
+            result.tag == tc["rob_tag"]
+        ), f"tag mismatch: got {result.tag}, expected {tc['rob_tag']}"
         assert (
-            result["value"] == tc["expected"]
-        ), f"Expected {tc['expected']}, got {result['value']} for tag {tc['rob_tag']}"
+            result.value == tc["expected"]
+        ), f"Expected {tc['expected']}, got {result.value} for tag {tc['rob_tag']}"
 
 
 # ============================================================================
@@ -853,7 +718,7 @@ async def test_mul_during_inflight_div(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=1,
-        op=_op("DIV"),
+        op=OP_DIV,
         src1_value=42,
         src2_value=7,
     )
@@ -863,22 +728,26 @@ async def test_mul_during_inflight_div(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=2,
-        op=_op("MUL"),
+        op=OP_MUL,
         src1_value=7,
         src2_value=6,
     )
     await RisingEdge(iface.clock)
     iface.clear_issue()
 
-    # MUL should complete first (~4 cycles)
-    mul_result = await wait_for_mul_complete(iface)
-    assert mul_result["tag"] == 2, f"MUL tag mismatch: got {mul_result['tag']}"
-    assert mul_result["value"] == 42, f"MUL expected 42, got {mul_result['value']}"
+    # The two units complete independently (MUL ~4 cycles, DIV ~17), so
+    # wait on both ports at once rather than one after the other.
+    mul_task = cocotb.start_soon(wait_for_mul_complete(iface))
+    div_task = cocotb.start_soon(wait_for_div_complete(iface))
+    await Combine(mul_task, div_task)
 
-    # DIV should complete later (~17 cycles)
-    div_result = await wait_for_div_complete(iface)
-    assert div_result["tag"] == 1, f"DIV tag mismatch: got {div_result['tag']}"
-    assert div_result["value"] == 6, f"DIV expected 6, got {div_result['value']}"
+    mul_result = mul_task.result()
+    assert mul_result.tag == 2, f"MUL tag mismatch: got {mul_result.tag}"
+    assert mul_result.value == 42, f"MUL expected 42, got {mul_result.value}"
+
+    div_result = div_task.result()
+    assert div_result.tag == 1, f"DIV tag mismatch: got {div_result.tag}"
+    assert div_result.value == 6, f"DIV expected 6, got {div_result.value}"
 
 
 # ============================================================================
@@ -893,7 +762,7 @@ async def test_flush_multiple_inflight_divs(dut: Any) -> None:
         iface.drive_issue(
             valid=True,
             rob_tag=tag,
-            op=_op("DIV"),
+            op=OP_DIV,
             src1_value=tag * 10,
             src2_value=tag,
         )
@@ -905,16 +774,11 @@ async def test_flush_multiple_inflight_divs(dut: Any) -> None:
     iface.drive_flush()
     await RisingEdge(iface.clock)
     iface.clear_flush()
-    await FallingEdge(iface.clock)
 
     # No results should appear
-    for _ in range(MAX_LATENCY):
-        await RisingEdge(iface.clock)
-        await FallingEdge(iface.clock)
-        result = iface.read_div_fu_complete()
-        assert (
-            result["valid"] is False
-        ), "All DIV results should be suppressed after flush"
+    await expect_no_fu_complete(
+        iface.div_fu_complete_handle, MAX_LATENCY * CLOCK_PERIOD_NS
+    )
 
 
 # ============================================================================
@@ -935,7 +799,7 @@ async def test_partial_flush_mixed_ages(dut: Any) -> None:
         iface.drive_issue(
             valid=True,
             rob_tag=tags[i],
-            op=_op("DIV"),
+            op=OP_DIV,
             src1_value=dividends[i],
             src2_value=divisors[i],
         )
@@ -950,15 +814,13 @@ async def test_partial_flush_mixed_ages(dut: Any) -> None:
 
     # Only tag 2 (100/10=10) should produce a valid result
     result = await wait_for_div_complete(iface)
-    assert result["tag"] == 2, f"Expected tag 2, got {result['tag']}"
-    assert result["value"] == 10, f"Expected 10, got {result['value']}"
+    assert result.tag == 2, f"Expected tag 2, got {result.tag}"
+    assert result.value == 10, f"Expected 10, got {result.value}"
 
     # No more valid results should appear
-    for _ in range(MAX_LATENCY):
-        await RisingEdge(iface.clock)
-        await FallingEdge(iface.clock)
-        result = iface.read_div_fu_complete()
-        assert result["valid"] is False, "Younger DIV results should be suppressed"
+    await expect_no_fu_complete(
+        iface.div_fu_complete_handle, MAX_LATENCY * CLOCK_PERIOD_NS
+    )
 
 
 # ============================================================================
@@ -974,7 +836,7 @@ async def test_fifo_backpressure(dut: Any) -> None:
         iface.drive_issue(
             valid=True,
             rob_tag=tag,
-            op=_op("DIV"),
+            op=OP_DIV,
             src1_value=tag * 10,
             src2_value=tag,
         )
@@ -989,8 +851,7 @@ async def test_fifo_backpressure(dut: Any) -> None:
     ), "busy should be 1 with 4 DIVs in-flight (FIFO_DEPTH reached)"
 
     # Pop results as they complete; busy should drop after first pop
-    result = await wait_for_div_complete(iface)
-    assert result["valid"], "Expected valid completion"
+    await wait_for_div_complete(iface)
     await FallingEdge(iface.clock)
 
     # After popping one, inflight + fifo < FIFO_DEPTH, busy should drop
@@ -1012,7 +873,7 @@ async def test_partial_flush_at_completion(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=10,
-        op=_op("DIV"),
+        op=OP_DIV,
         src1_value=42,
         src2_value=7,
     )
@@ -1022,8 +883,7 @@ async def test_partial_flush_at_completion(dut: Any) -> None:
     # Wait until 1 cycle before the divider output is expected (16 cycles
     # after the issue edge, so the valid appears on the 17th rising edge).
     # We've already consumed 1 edge above, so wait 15 more.
-    for _ in range(15):
-        await RisingEdge(iface.clock)
+    await ClockCycles(iface.clock, 15)
 
     # Now assert partial flush on the SAME cycle the tail valid goes high.
     # flush_tag=5, head=0  =>  tag 10 is younger, should be squashed.
@@ -1033,14 +893,9 @@ async def test_partial_flush_at_completion(dut: Any) -> None:
     await FallingEdge(iface.clock)
 
     # The result must NOT appear in the FIFO output.
-    for _ in range(MAX_LATENCY):
-        await RisingEdge(iface.clock)
-        await FallingEdge(iface.clock)
-        result = iface.read_div_fu_complete()
-        assert result["valid"] is False, (
-            "DIV result should be suppressed when partial flush "
-            "coincides with divider completion"
-        )
+    await expect_no_fu_complete(
+        iface.div_fu_complete_handle, MAX_LATENCY * CLOCK_PERIOD_NS
+    )
 
 
 # ============================================================================
@@ -1058,7 +913,7 @@ async def test_partial_flush_fifo_head(dut: Any) -> None:
     iface.drive_issue(
         valid=True,
         rob_tag=10,
-        op=_op("DIV"),
+        op=OP_DIV,
         src1_value=42,
         src2_value=7,
     )
@@ -1066,17 +921,12 @@ async def test_partial_flush_fifo_head(dut: Any) -> None:
     iface.clear_issue()
 
     # Wait for the result to appear in the FIFO (divider completes)
-    result = None
-    for _ in range(MAX_LATENCY):
-        await RisingEdge(iface.clock)
-        await FallingEdge(iface.clock)
-        result = iface.read_div_fu_complete()
-        if result["valid"]:
-            break
-
-    assert (
-        result is not None and result["valid"]
-    ), "DIV result should appear before flush"
+    result = await wait_for_fu_complete(
+        iface.clock, iface.div_fu_complete_handle, MAX_LATENCY, CLOCK_PERIOD_NS
+    )
+    assert result.valid, "DIV result should appear before flush"
+    # Leave the read-only region before driving the flush.
+    await FallingEdge(iface.clock)
 
     # Do NOT pop (no i_div_accepted). The result sits in the FIFO head.
     # Now partial-flush with flush_tag=5, head=0 => tag 10 is younger.
@@ -1088,12 +938,8 @@ async def test_partial_flush_fifo_head(dut: Any) -> None:
     # The FIFO head should now be suppressed (auto-drained as flushed).
     result = iface.read_div_fu_complete()
     assert (
-        result["valid"] is False
+        result.valid is False
     ), "FIFO head should be suppressed after partial flush of younger tag"
 
     # Verify it stays suppressed (entry was auto-drained)
-    for _ in range(5):
-        await RisingEdge(iface.clock)
-        await FallingEdge(iface.clock)
-        result = iface.read_div_fu_complete()
-        assert result["valid"] is False, "Flushed FIFO entry should remain suppressed"
+    await expect_no_fu_complete(iface.div_fu_complete_handle, 5 * CLOCK_PERIOD_NS)
@@ -36,9 +36,12 @@ MEM_SIZE_WORD = 2
 MEM_SIZE_DOUBLE = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class LQEntry:
-    """One load queue entry."""
+    """One load queue entry.
+
+    Slotted: the issue scan reads several of these fields per entry per cycle.
+    """
 
     valid: bool = False
     rob_tag: int = 0
@@ -58,7 +61,7 @@ class LQEntry:
     amo_rs2: int = 0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FuComplete:
     """FU completion result."""
 
@@ -70,7 +73,7 @@ class FuComplete:
     fp_flags: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class SQForwardResult:
     """Store-to-load forwarding result."""
 
@@ -79,20 +82,25 @@ class SQForwardResult:
     data: int = 0
 
 
-def sign_extend_byte(val: int, unsigned: bool) -> int:
-    """Sign/zero extend a byte to 32 bits."""
-    val = val & 0xFF
-    if not unsigned and (val & 0x80):
-        return val | 0xFFFFFF00
-    return val
+def _load_unit_lane(
+    size: int, sign_ext: bool, offset: int
+) -> tuple[int, int, int, int]:
+    """Return (shift, mask, sign_bit, ext) for one load_unit_model case."""
+    if size == MEM_SIZE_BYTE:
+        return offset * 8, 0xFF, 0x80 if sign_ext else 0, 0xFFFFFF00
+    if size == MEM_SIZE_HALF:
+        return (offset >> 1) * 16, 0xFFFF, 0x8000 if sign_ext else 0, 0xFFFF0000
+    return (offset >> 2) * 32, MASK32, 0, 0
 
 
-def sign_extend_half(val: int, unsigned: bool) -> int:
-    """Sign/zero extend a halfword to 32 bits."""
-    val = val & 0xFFFF
-    if not unsigned and (val & 0x8000):
-        return val | 0xFFFF0000
-    return val
+# (size, sign_ext, address[2:0]) -> (shift, mask, sign_bit, ext) for every
+# load_unit_model case, so the per-response path is one lookup.
+_LOAD_UNIT_LANES = {
+    (size, sign_ext, offset): _load_unit_lane(size, sign_ext, offset)
+    for size in (MEM_SIZE_BYTE, MEM_SIZE_HALF, MEM_SIZE_WORD, MEM_SIZE_DOUBLE)
+    for sign_ext in (False, True)
+    for offset in range(8)
+}
 
 
 def load_unit_model(size: int, sign_ext: bool, address: int, raw_data: int) -> int:
@@ -100,20 +108,16 @@ def load_unit_model(size: int, sign_ext: bool, address: int, raw_data: int) -> i
 
     The data tier returns the aligned dword at addr[31:3]; the load unit
     selects the addressed byte/half/word by addr[2:0]
-    (docs/rv64/m1_data_tier.md).
+    (docs/rv64/m1_data_tier.md).  Sizes other than byte and half take the
+    word path.
     """
-    raw_data = raw_data & MASK64
-    if size == MEM_SIZE_BYTE:
-        byte_sel = address & 0x7
-        byte_val = (raw_data >> (byte_sel * 8)) & 0xFF
-        return sign_extend_byte(byte_val, not sign_ext) & MASK32
-    elif size == MEM_SIZE_HALF:
-        half_sel = (address >> 1) & 0x3
-        half_val = (raw_data >> (half_sel * 16)) & 0xFFFF
-        return sign_extend_half(half_val, not sign_ext) & MASK32
-    else:
-        word_sel = (address >> 2) & 0x1
-        return (raw_data >> (word_sel * 32)) & MASK32
+    shift, mask, sign_bit, ext = _LOAD_UNIT_LANES[
+        (size & 0x3, bool(sign_ext), address & 0x7)
+    ]
+    val = (raw_data >> shift) & mask
+    if val & sign_bit:
+        return val | ext
+    return val
 
 
 def is_younger(entry_tag: int, flush_tag: int, head: int) -> bool:
@@ -129,13 +133,26 @@ class LQModel:
 
     def __init__(self, depth: int = LQ_DEPTH) -> None:
         """Initialize with empty state."""
+        if depth <= 0 or depth & (depth - 1):
+            raise ValueError(f"LQ depth must be a power of two, got {depth}")
         self.depth = depth
         self.entries: list[LQEntry] = [LQEntry() for _ in range(depth)]
         self.head_ptr = 0
         self.tail_ptr = 0
         self.mem_outstanding = False
         self.issued_idx = 0
-        self._ptr_wrap = 2 * depth  # Pointer wrapping boundary
+        # Pointers carry one wrap bit above the index, as in the RTL; depth is
+        # a power of two, so wrapping and indexing are plain masks.
+        self._idx_mask = depth - 1
+        self._wrap_mask = 2 * depth - 1
+        # Valid-entry count, kept in step with every valid-bit change so
+        # count/full/empty do not rescan the entries.
+        self._count = 0
+        # Last _issue_scan result as ((rob_head_tag, sq_committed_empty),
+        # (cdb_idx, mem_idx)); dropped by every entry or head mutation.
+        self._scan_cache: (
+            tuple[tuple[int, bool], tuple[int | None, int | None]] | None
+        ) = None
         self.cdb_stage = FuComplete()
         # Reservation register (LR/SC)
         self.reservation_valid = False
@@ -146,12 +163,19 @@ class LQModel:
         self.amo_entry_idx = 0
 
     def reset(self) -> None:
-        """Reset to empty state."""
-        self.entries = [LQEntry() for _ in range(self.depth)]
+        """Reset to empty state.
+
+        Entries are invalidated in place: alloc() rewrites every field of the
+        slot it claims, and nothing reads an invalid entry's other fields.
+        """
+        for e in self.entries:
+            e.valid = False
         self.head_ptr = 0
         self.tail_ptr = 0
         self.mem_outstanding = False
         self.issued_idx = 0
+        self._count = 0
+        self._scan_cache = None
         self.cdb_stage = FuComplete()
         self.reservation_valid = False
         self.reservation_addr = 0
@@ -162,21 +186,17 @@ class LQModel:
     @property
     def head_idx(self) -> int:
         """Return the head pointer index within the circular buffer."""
-        return self.head_ptr % self.depth
+        return self.head_ptr & self._idx_mask
 
     @property
     def tail_idx(self) -> int:
         """Return the tail pointer index within the circular buffer."""
-        return self.tail_ptr % self.depth
+        return self.tail_ptr & self._idx_mask
 
     @property
     def count(self) -> int:
         """Return the number of valid entries."""
-        n = 0
-        for e in self.entries:
-            if e.valid:
-                n += 1
-        return n
+        return self._count
 
     @property
     def full(self) -> bool:
@@ -203,10 +223,10 @@ class LQModel:
             return False
         ptr = self.tail_ptr
         for _ in range(self.depth):
-            if not self.entries[ptr % self.depth].valid:
+            if not self.entries[ptr & self._idx_mask].valid:
                 break
-            ptr = (ptr + 1) % self._ptr_wrap
-        idx = ptr % self.depth
+            ptr = (ptr + 1) & self._wrap_mask
+        idx = ptr & self._idx_mask
         e = self.entries[idx]
         e.valid = True
         e.rob_tag = rob_tag & MASK_TAG
@@ -224,7 +244,9 @@ class LQModel:
         e.is_amo = is_amo
         e.amo_op = amo_op
         e.amo_rs2 = 0
-        self.tail_ptr = (ptr + 1) % self._ptr_wrap
+        self.tail_ptr = (ptr + 1) & self._wrap_mask
+        self._count += 1
+        self._scan_cache = None
         return True
 
     def addr_update(
@@ -241,6 +263,7 @@ class LQModel:
                 e.address = address & MASK32
                 e.is_mmio = is_mmio
                 e.amo_rs2 = amo_rs2 & MASK32
+                self._scan_cache = None
 
     def _issue_scan(
         self,
@@ -251,11 +274,16 @@ class LQModel:
 
         LR entries require rob_tag == rob_head_tag.
         AMO entries require rob_tag == rob_head_tag AND sq_committed_empty.
+        The result is cached until the next entry or head-pointer change.
         """
+        key = (rob_head_tag, sq_committed_empty)
+        if self._scan_cache is not None and self._scan_cache[0] == key:
+            return self._scan_cache[1]
         cdb_idx = None
         mem_idx = None
+        head_idx = self.head_idx
         for i in range(self.depth):
-            idx = (self.head_idx + i) % self.depth
+            idx = (head_idx + i) & self._idx_mask
             e = self.entries[idx]
             if e.valid:
                 if cdb_idx is None and e.data_valid:
@@ -279,7 +307,7 @@ class LQModel:
 
         if mem_idx is None:
             for i in range(self.depth):
-                idx = (self.head_idx + i) % self.depth
+                idx = (head_idx + i) & self._idx_mask
                 e = self.entries[idx]
                 if e.valid and e.addr_valid and not e.issued and not e.data_valid:
                     # LR/AMO gating
@@ -291,6 +319,7 @@ class LQModel:
                         continue
                     mem_idx = idx
                     break
+        self._scan_cache = (key, (cdb_idx, mem_idx))
         return cdb_idx, mem_idx
 
     def apply_forward(self, sq_forward: SQForwardResult) -> None:
@@ -303,6 +332,7 @@ class LQModel:
             e.data_valid = True
             e.forwarded = True
             e.data = sq_forward.data & MASK64
+            self._scan_cache = None
 
     def cache_hit_complete(self) -> None:
         """Model DUT cache-hit fast path for the current Phase B candidate.
@@ -324,6 +354,7 @@ class LQModel:
             return
 
         e.data_valid = True
+        self._scan_cache = None
 
     def issue_to_memory(
         self, all_older_known: bool, sq_forward: SQForwardResult
@@ -338,6 +369,7 @@ class LQModel:
             return None
 
         e.issued = True
+        self._scan_cache = None
         self.mem_outstanding = True
         self.issued_idx = mem_idx
 
@@ -350,6 +382,7 @@ class LQModel:
         idx = self.issued_idx
         e = self.entries[idx]
         data = data & MASK64
+        self._scan_cache = None
 
         if e.is_amo:
             # AMO: latch the addressed word as old value, start write phase
@@ -386,6 +419,7 @@ class LQModel:
         e = self.entries[idx]
         e.data = self.amo_old_value & MASK64
         e.data_valid = True
+        self._scan_cache = None
         self.amo_state = 0
 
     def sc_clear_reservation(self) -> None:
@@ -413,7 +447,9 @@ class LQModel:
         else:
             value = e.data & MASK32
         self.cdb_stage = FuComplete(valid=True, tag=e.rob_tag, value=value & MASK64)
-        self.entries[cdb_idx].valid = False
+        e.valid = False
+        self._count -= 1
+        self._scan_cache = None
 
     def get_fu_complete(self, adapter_pending: bool = False) -> FuComplete:
         """Get the staged FU completion output."""
@@ -436,7 +472,8 @@ class LQModel:
     def advance_head(self) -> None:
         """Advance head pointer past freed entries."""
         while self.count and not self.entries[self.head_idx].valid:
-            self.head_ptr = (self.head_ptr + 1) % self._ptr_wrap
+            self.head_ptr = (self.head_ptr + 1) & self._wrap_mask
+            self._scan_cache = None
 
     def flush_all(self) -> None:
         """Full flush: clear all state (including reservation)."""
@@ -470,12 +507,16 @@ class LQModel:
         After invalidating, retract tail_ptr backwards past consecutive
         invalid entries at the tail end.
         """
+        # Inline is_younger() with the flush tag's age computed once.
+        head = rob_head_tag & MASK_TAG
+        flush_age = (flush_tag - head) & MASK_TAG
         for e in self.entries:
-            if e.valid and is_younger(
-                e.rob_tag, flush_tag & MASK_TAG, rob_head_tag & MASK_TAG
-            ):
+            if e.valid and ((e.rob_tag - head) & MASK_TAG) > flush_age:
                 e.valid = False
-        if self.cdb_stage.valid and is_younger(
-            self.cdb_stage.tag, flush_tag & MASK_TAG, rob_head_tag & MASK_TAG
+                self._count -= 1
+                self._scan_cache = None
+        if (
+            self.cdb_stage.valid
+            and ((self.cdb_stage.tag - head) & MASK_TAG) > flush_age
         ):
             self.cdb_stage = FuComplete()